@@ -7,21 +7,125 @@ with all necessary dependencies and assets included.
 Usage:
     python build_tools/build_exe.py
     python build_tools/build_exe.py --clean  # Clean build artifacts
+    python build_tools/build_exe.py --no-compress  # Skip size optimizations (faster, larger)
 """
 
+import hashlib
 import os
+import re
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
 
-# Add parent directory to path to import version
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from tycoon_engine.version import __version__
 
+def read_version(project_root: Path) -> str:
+    """
+    Read __version__ from tycoon_engine/version.py.
+    
+    The file is parsed rather than imported so the build script does not
+    load the engine package (and pygame) just to get the version string.
+    
+    Args:
+        project_root: Project root directory
+        
+    Returns:
+        Version string
+    """
+    version_file = project_root / "tycoon_engine" / "version.py"
+    match = re.search(r'__version__\s*=\s*"([^"]+)"', version_file.read_text(encoding='utf-8'))
+    if not match:
+        raise ValueError(f"Could not find version in {version_file}")
+    return match.group(1)
+
+
+__version__ = read_version(Path(__file__).parent.parent)
 
-def build_exe():
-    """Build the game as a Windows executable."""
+
+# Standard library modules the game never imports; excluding them keeps
+# them out of the bundle. email/xml are deliberately not listed because
+# http.client (used by the networking stack) depends on them.
+EXCLUDED_MODULES = [
+    "tkinter",
+    "unittest",
+    "pydoc",
+    "test",
+    "pip",
+    "setuptools",
+    "distutils",
+]
+
+
+def compute_fingerprint(project_root: Path, options: List[str]) -> str:
+    """
+    Hash everything that affects the build output.
+    
+    Args:
+        project_root: Project root directory
+        options: PyInstaller options the spec is generated with
+        
+    Returns:
+        SHA-256 hex digest of the version, options and source file stats
+    """
+    digest = hashlib.sha256()
+    digest.update(__version__.encode())
+    digest.update("\0".join(options).encode())
+    
+    sources = sorted(
+        list((project_root / "tycoon_engine").rglob("*.py"))
+        + [p for p in (project_root / "examples" / "demo_tycoon").rglob("*") if p.is_file()]
+        + [p for p in (project_root / "assets").rglob("*") if p.is_file()]
+    )
+    for path in sources:
+        stat = path.stat()
+        digest.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+    
+    return digest.hexdigest()
+
+
+def run_streaming(cmd: List[str], cwd: Path) -> None:
+    """
+    Run a command, echoing its combined stdout/stderr line by line.
+    
+    Merging both streams keeps PyInstaller's log output (written to stderr)
+    in order with its regular output, and the pipe is drained continuously.
+    
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory
+        
+    Raises:
+        subprocess.CalledProcessError: If the command exits with an error
+    """
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        returncode = proc.wait()
+    
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def build_exe(compress: bool = True):
+    """
+    Build the game as a Windows executable.
+    
+    The spec file is generated with ``pyi-makespec`` and the build inputs are
+    fingerprinted, so repeated builds of unchanged sources return immediately.
+    
+    Args:
+        compress: Optimize bytecode, strip symbols, exclude unused modules
+            and compress with UPX (when available) to reduce the executable size
+    """
     
     # Get project root
     project_root = Path(__file__).parent.parent
@@ -30,6 +134,7 @@ def build_exe():
     main_script = project_root / "examples" / "demo_tycoon" / "main.py"
     dist_dir = project_root / "dist"
     build_dir = project_root / "build"
+    fingerprint_file = build_dir / ".build_fingerprint"
     
     if not main_script.exists():
         print(f"Error: Main script not found at {main_script}")
@@ -38,14 +143,44 @@ def build_exe():
     print(f"Building Windows EXE with PyInstaller (v{__version__})...")
     print(f"Main script: {main_script}")
     
-    # Build PyInstaller command
-    cmd = [
-        "pyinstaller",
+    exe_name = f"LemonadeStandTycoon-v{__version__}"
+    exe_path = dist_dir / (exe_name + (".exe" if os.name == "nt" else ""))
+    spec_path = project_root / f"{exe_name}.spec"
+    
+    # Options baked into the generated spec file
+    spec_options = [
         "--onefile",  # Single executable file
         "--windowed",  # No console window (use --console for debugging)
-        "--name", f"LemonadeStandTycoon-v{__version__}",
-        "--add-data", f"{project_root / 'tycoon_engine'}{os.pathsep}tycoon_engine",
+        "--name", exe_name,
+        # Freeze the engine as modules only; bundling it as data too would
+        # ship a second copy of the package
+        "--collect-submodules", "tycoon_engine",
+        "--collect-data", "tycoon_engine",
     ]
+    # Options applied when building from the spec file
+    build_options = ["--noconfirm"]
+    
+    if compress:
+        # Strip docstrings and asserts from bundled bytecode (same as -OO);
+        # tycoon_engine does not rely on either at runtime
+        spec_options.extend(["--optimize", "2"])
+        
+        for module in EXCLUDED_MODULES:
+            spec_options.extend(["--exclude-module", module])
+        
+        # Stripping is not recommended for Windows binaries
+        if os.name != "nt":
+            spec_options.append("--strip")
+        
+        upx_path = shutil.which("upx")
+        if upx_path:
+            print(f"Compressing with UPX from: {upx_path}")
+            build_options.extend(["--upx-dir", str(Path(upx_path).parent)])
+        else:
+            print("UPX not found, building without compression")
+            spec_options.append("--noupx")
+    else:
+        spec_options.append("--noupx")
     
     # Check for assets directories and include them
     # Note: Both are added to the same "assets" destination folder
@@ -55,22 +190,38 @@ def build_exe():
         (project_root / "examples" / "demo_tycoon" / "assets", "assets/demo"),
     ]
     
-    for assets_dir, dest_name in assets_dirs:
-        if assets_dir.exists():
+    # Check all directories at once so slow stats (network drives,
+    # antivirus hooks) overlap instead of running back to back
+    with ThreadPoolExecutor(max_workers=len(assets_dirs)) as executor:
+        exists = list(executor.map(lambda item: item[0].exists(), assets_dirs))
+    
+    for (assets_dir, dest_name), found in zip(assets_dirs, exists):
+        if found:
             print(f"Including assets from: {assets_dir} -> {dest_name}")
-            cmd.extend(["--add-data", f"{assets_dir}{os.pathsep}{dest_name}"])
+            spec_options.extend(["--add-data", f"{assets_dir}{os.pathsep}{dest_name}"])
     
-    # Add the main script as the last argument
-    cmd.append(str(main_script))
+    fingerprint = compute_fingerprint(project_root, spec_options + build_options)
+    if (
+        exe_path.exists()
+        and fingerprint_file.exists()
+        and fingerprint_file.read_text() == fingerprint
+    ):
+        print(f"Build is up to date: {exe_path}")
+        return True
     
     try:
-        # Run PyInstaller
-        result = subprocess.run(cmd, cwd=project_root, check=True)
+        # Generate the spec file, then build from it. PyInstaller keeps its
+        # analysis cache in build/, so unchanged modules are not re-analyzed.
+        run_streaming(["pyi-makespec", *spec_options, str(main_script)], project_root)
+        run_streaming(["pyinstaller", *build_options, str(spec_path)], project_root)
+        
+        build_dir.mkdir(exist_ok=True)
+        fingerprint_file.write_text(fingerprint)
         
         print("\n" + "="*60)
         print("Build completed successfully!")
         print(f"Version: {__version__}")
-        print(f"Executable location: {dist_dir / f'LemonadeStandTycoon-v{__version__}.exe'}")
+        print(f"Executable location: {exe_path}")
         print("="*60)
         
         return True
@@ -96,10 +247,14 @@ def clean_build():
         project_root / "__pycache__"
     ]
     
-    for dir_path in dirs_to_clean:
-        if dir_path.exists():
-            print(f"Removing {dir_path}")
-            shutil.rmtree(dir_path)
+    existing_dirs = [dir_path for dir_path in dirs_to_clean if dir_path.exists()]
+    for dir_path in existing_dirs:
+        print(f"Removing {dir_path}")
+    
+    # Remove the trees concurrently; each rmtree is bound by unlink calls
+    if existing_dirs:
+        with ThreadPoolExecutor(max_workers=len(existing_dirs)) as executor:
+            list(executor.map(shutil.rmtree, existing_dirs))
     
     # Remove spec files
     for spec_file in project_root.glob("*.spec"):
@@ -108,14 +263,13 @@ def clean_build():
 
 
 if __name__ == "__main__":
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Build game executable")
-    parser.add_argument("--clean", action="store_true", help="Clean build artifacts")
+    args = sys.argv[1:]
     
-    args = parser.parse_args()
+    if any(arg not in ("--clean", "--no-compress") for arg in args):
+        print(__doc__)
+        sys.exit(0 if args in (["-h"], ["--help"]) else 1)
     
-    if args.clean:
+    if "--clean" in args:
         clean_build()
     else:
-        build_exe()
+        build_exe(compress="--no-compress" not in args)
@@ -15,6 +15,12 @@ import sys
 import re
 from pathlib import Path
 
+try:
+    import tomllib
+    TOMLLIB_AVAILABLE = True
+except ImportError:  # Python < 3.11
+    TOMLLIB_AVAILABLE = False
+
 
 def get_current_version(version_file):
     """Extract current version from version.py."""
@@ -31,22 +37,66 @@ def get_current_version(version_file):
     return tuple(int(x) for x in match.groups())
 
 
+# Version bump functions by bump type
+_BUMPERS = {
+    "major": lambda v: (v[0] + 1, 0, 0),
+    "minor": lambda v: (v[0], v[1] + 1, 0),
+    "patch": lambda v: (v[0], v[1], v[2] + 1),
+}
+
+
 def bump_version(version, bump_type):
     """Bump version based on type (major, minor, patch)."""
-    major, minor, patch = version
-    
-    if bump_type == "major":
-        return (major + 1, 0, 0)
-    elif bump_type == "minor":
-        return (major, minor + 1, 0)
-    elif bump_type == "patch":
-        return (major, minor, patch + 1)
-    else:
+    bumper = _BUMPERS.get(bump_type)
+    if bumper is None:
         raise ValueError(f"Invalid bump type: {bump_type}. Use 'major', 'minor', or 'patch'")
+    return bumper(version)
 
 
-def update_version_file(version_file, new_version):
-    """Update version.py with new version."""
+def replace_version_line(content, key, version_str, section=None):
+    """
+    Rewrite the first ``key = "..."`` assignment in a single pass over lines.
+    
+    Args:
+        content: File content
+        key: Assignment name to look for (e.g. ``__version__``)
+        version_str: New version string
+        section: Only match inside this TOML table header (e.g. ``[project]``)
+    
+    Returns:
+        Updated content
+    """
+    lines = content.splitlines(keepends=True)
+    in_section = section is None
+    
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if section is not None and stripped.startswith("["):
+            in_section = stripped == section
+            continue
+        
+        name, sep, _ = stripped.partition("=")
+        if in_section and sep and name.rstrip() == key:
+            indent = line[:len(line) - len(line.lstrip())]
+            newline = line[len(line.rstrip("\r\n")):]
+            lines[i] = f'{indent}{key} = "{version_str}"{newline}'
+            break
+    
+    return "".join(lines)
+
+
+def _write_file(path, content):
+    """Write updated content back to a file."""
+    try:
+        path.write_text(content, encoding='utf-8')
+    except PermissionError:
+        raise PermissionError(f"Permission denied writing: {path}")
+    
+    print(f"✓ Updated {path.name}")
+
+
+def render_version_file(version_file, new_version):
+    """Return the content of version.py with the new version, without writing it."""
     version_str = ".".join(str(x) for x in new_version)
     try:
         content = version_file.read_text(encoding='utf-8')
@@ -56,22 +106,11 @@ def update_version_file(version_file, new_version):
         raise PermissionError(f"Permission denied reading: {version_file}")
     
     # Update __version__
-    content = re.sub(
-        r'__version__\s*=\s*"[^"]*"',
-        f'__version__ = "{version_str}"',
-        content
-    )
-    
-    try:
-        version_file.write_text(content, encoding='utf-8')
-    except PermissionError:
-        raise PermissionError(f"Permission denied writing: {version_file}")
-    
-    print(f"✓ Updated {version_file.name}")
+    return replace_version_line(content, "__version__", version_str)
 
 
-def update_pyproject_toml(pyproject_file, new_version):
-    """Update pyproject.toml with new version."""
+def render_pyproject_toml(pyproject_file, new_version):
+    """Return the content of pyproject.toml with the new version, without writing it."""
     version_str = ".".join(str(x) for x in new_version)
     try:
         content = pyproject_file.read_text(encoding='utf-8')
@@ -80,25 +119,34 @@ def update_pyproject_toml(pyproject_file, new_version):
     except PermissionError:
         raise PermissionError(f"Permission denied reading: {pyproject_file}")
     
-    # Update version line in [project] section
-    # More specific pattern to match only the project version
-    content = re.sub(
-        r'(\[project\].*?version\s*=\s*)"[^"]*"',
-        r'\1"' + version_str + '"',
-        content,
-        flags=re.DOTALL
-    )
+    # Update version line in [project] section only
+    content = replace_version_line(content, "version", version_str, section="[project]")
     
-    try:
-        pyproject_file.write_text(content, encoding='utf-8')
-    except PermissionError:
-        raise PermissionError(f"Permission denied writing: {pyproject_file}")
+    # Confirm with a real TOML parser that [project].version was the line
+    # rewritten (catches dotted keys or inline tables the scanner skips)
+    if TOMLLIB_AVAILABLE:
+        try:
+            written = tomllib.loads(content).get("project", {}).get("version")
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Invalid pyproject.toml after update: {e}")
+        if written != version_str:
+            raise ValueError("Could not find version in the [project] table of pyproject.toml")
     
-    print(f"✓ Updated {pyproject_file.name}")
+    return content
+
+
+def update_version_file(version_file, new_version):
+    """Update version.py with new version."""
+    _write_file(version_file, render_version_file(version_file, new_version))
+
+
+def update_pyproject_toml(pyproject_file, new_version):
+    """Update pyproject.toml with new version."""
+    _write_file(pyproject_file, render_pyproject_toml(pyproject_file, new_version))
 
 
 def main():
-    if len(sys.argv) != 2 or sys.argv[1] not in ("major", "minor", "patch"):
+    if len(sys.argv) != 2 or sys.argv[1] not in _BUMPERS:
         print(__doc__)
         sys.exit(1)
     
@@ -118,20 +166,25 @@ def main():
         new_version = bump_version(current_version, bump_type)
         new_str = ".".join(str(x) for x in new_version)
         
-        print(f"\nBumping version ({bump_type}):")
-        print(f"  {current_str} -> {new_str}")
-        print()
+        sys.stdout.write(f"\nBumping version ({bump_type}):\n  {current_str} -> {new_str}\n\n")
+        
+        # Prepare and validate both files before writing either, so a bad
+        # pyproject.toml can't leave them on different versions
+        version_content = render_version_file(version_file, new_version)
+        pyproject_content = render_pyproject_toml(pyproject_file, new_version)
         
         # Update files
-        update_version_file(version_file, new_version)
-        update_pyproject_toml(pyproject_file, new_version)
+        _write_file(version_file, version_content)
+        _write_file(pyproject_file, pyproject_content)
         
-        print(f"\n✓ Version bumped to {new_str}")
-        print("\nNext steps:")
-        print("  1. Review the changes: git diff")
-        print("  2. Commit the changes: git add . && git commit -m 'Bump version to {}'".format(new_str))
-        print("  3. Create a tag: git tag -a v{} -m 'Release v{}'".format(new_str, new_str))
-        print("  4. Push changes: git push && git push --tags")
+        sys.stdout.write(
+            f"\n✓ Version bumped to {new_str}\n"
+            "\nNext steps:\n"
+            "  1. Review the changes: git diff\n"
+            f"  2. Commit the changes: git add . && git commit -m 'Bump version to {new_str}'\n"
+            f"  3. Create a tag: git tag -a v{new_str} -m 'Release v{new_str}'\n"
+            "  4. Push changes: git push && git push --tags\n"
+        )
     
     except (FileNotFoundError, PermissionError, ValueError) as e:
         print(f"\nError: {e}", file=sys.stderr)
@@ -10,7 +10,6 @@ from tycoon_engine.core.config import GameConfig
 from tycoon_engine.core.state_manager import GameState
 from tycoon_engine.entities.entity import EntityManager
 from tycoon_engine.entities.resources import ResourceManager
-from tycoon_engine.ui.renderer import UIRenderer
 
 
 class PlayingState(GameState):
@@ -20,13 +19,31 @@ class PlayingState(GameState):
         """Initialize playing state."""
         self.entity_manager = EntityManager()
         self.resource_manager = ResourceManager(starting_money=self.config.starting_money)
-        self.ui = UIRenderer()
         
         # Game variables
         self.lemonade_price = 1.0
         self.production_rate = 1.0  # Lemonades per second
         self.production_timer = 0.0
         
+        # Stats panel background, built once in the display's pixel format
+        self._panel_position = (20, 100)
+        self._panel = pygame.Surface((400, 300)).convert()
+        self._panel.fill((0, 100, 0))
+        pygame.draw.rect(self._panel, (100, 100, 100), self._panel.get_rect(), 2)
+        self._panel.set_alpha(200)
+        
+        # Fonts and text that never change are created once, not every frame
+        self._fonts = {size: pygame.font.Font(None, size) for size in (24, 32, 48)}
+        self._static_text = [
+            (self._fonts[48].render("Lemonade Stand Tycoon", True, (255, 255, 0)), (20, 20)),
+            (self._fonts[24].render("SPACE: Buy Upgrade ($100)", True, (255, 255, 255)), (20, 450)),
+            (self._fonts[24].render("UP/DOWN: Adjust Price", True, (255, 255, 255)), (20, 480)),
+            (self._fonts[24].render("ESC: Quit", True, (255, 255, 255)), (20, 510)),
+        ]
+        
+        # Rendered stat lines, keyed by name: (text, surface)
+        self._text_cache = {}
+        
         print("Demo Tycoon Game Started!")
         print("Press SPACE to buy production upgrade ($100)")
         print("Press UP/DOWN to adjust lemonade price")
@@ -38,50 +55,61 @@ class PlayingState(GameState):
     
     def update(self, dt: float):
         """Update game logic."""
-        # Produce lemonade
+        # Produce lemonade, selling every unit completed since the last frame
         self.production_timer += dt
-        if self.production_timer >= 1.0 / self.production_rate:
-            self.production_timer = 0.0
-            # Sell one lemonade
-            self.resource_manager.add_money(self.lemonade_price)
-            self.resource_manager.add_resource('lemonades_sold', 1)
+        produced = int(self.production_timer * self.production_rate)
+        if produced:
+            self.production_timer -= produced / self.production_rate
+            self.resource_manager.add_money(produced * self.lemonade_price)
+            self.resource_manager.add_resource('lemonades_sold', produced)
     
     def render(self, screen: pygame.Surface):
         """Render the game."""
         screen.fill((135, 206, 235))  # Sky blue background
         
-        # Draw title
-        self.ui.draw_text(
-            screen,
-            "Lemonade Stand Tycoon",
-            (20, 20),
-            font_size=48,
-            color=(255, 255, 0)
-        )
-        
         # Draw stats panel
-        panel_rect = pygame.Rect(20, 100, 400, 300)
-        self.ui.draw_panel(screen, panel_rect, bg_color=(0, 100, 0), alpha=200)
+        screen.blit(self._panel, self._panel_position)
+        
+        # Draw title and instructions
+        for surface, position in self._static_text:
+            screen.blit(surface, position)
         
         # Draw stats
         money = self.resource_manager.get_money()
         sold = self.resource_manager.get_resource('lemonades_sold')
         
-        self.ui.draw_text(screen, f"Money: ${money:.2f}", (40, 120), font_size=32)
-        self.ui.draw_text(screen, f"Lemonades Sold: {int(sold)}", (40, 160), font_size=32)
-        self.ui.draw_text(screen, f"Price: ${self.lemonade_price:.2f}", (40, 200), font_size=32)
-        self.ui.draw_text(screen, f"Production: {self.production_rate:.1f}/sec", (40, 240), font_size=32)
+        screen.blit(self._text("money", f"Money: ${money:.2f}"), (40, 120))
+        screen.blit(self._text("sold", f"Lemonades Sold: {int(sold)}"), (40, 160))
+        screen.blit(self._text("price", f"Price: ${self.lemonade_price:.2f}"), (40, 200))
+        screen.blit(
+            self._text("production", f"Production: {self.production_rate:.1f}/sec"),
+            (40, 240)
+        )
+    
+    def _text(self, key: str, text: str) -> pygame.Surface:
+        """
+        Get the rendered surface for a stat line, re-rendering only on change.
+        
+        Args:
+            key: Name of the stat line
+            text: Current text of the line
+            
+        Returns:
+            Rendered text surface
+        """
+        cached = self._text_cache.get(key)
+        if cached is not None and cached[0] == text:
+            return cached[1]
         
-        # Draw instructions
-        self.ui.draw_text(screen, "SPACE: Buy Upgrade ($100)", (20, 450), font_size=24)
-        self.ui.draw_text(screen, "UP/DOWN: Adjust Price", (20, 480), font_size=24)
-        self.ui.draw_text(screen, "ESC: Quit", (20, 510), font_size=24)
+        surface = self._fonts[32].render(text, True, (255, 255, 255))
+        self._text_cache[key] = (text, surface)
+        return surface
     
     def handle_event(self, event: pygame.event.Event):
         """Handle input events."""
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
-                pygame.event.post(pygame.event.Event(pygame.QUIT))
+                self.state_manager.request_quit()
             
             elif event.key == pygame.K_SPACE:
                 # Buy production upgrade
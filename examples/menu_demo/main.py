@@ -36,6 +36,17 @@ class PlayingState(GameState):
         self.score = 0
         self.time_elapsed = 0.0
         
+        # Last values pushed to the HUD (money in whole cents, as displayed)
+        self._shown_cents = None
+        self._shown_score = None
+        
+        # Pre-render the static game text once in the display's pixel format
+        font = pygame.font.Font(None, 48)
+        self._title_surface = font.render("Game is Running!", True, (255, 255, 255)).convert_alpha()
+        self._title_rect = self._title_surface.get_rect(
+            center=(self.config.screen_width // 2, self.config.screen_height // 2)
+        )
+        
         print("Playing state started. Press ESC for menu.")
     
     def exit(self):
@@ -50,9 +61,14 @@ class PlayingState(GameState):
         # Slowly increase money
         self.money += dt * 5
         
-        # Update HUD
-        self.hud.set_money(self.money)
-        self.hud.set_resource('score', self.score, format_str="Score: {}")
+        # Update HUD labels only when the displayed value changes
+        cents = int(self.money * 100)
+        if cents != self._shown_cents:
+            self._shown_cents = cents
+            self.hud.set_money(self.money)
+        if self.score != self._shown_score:
+            self._shown_score = self.score
+            self.hud.set_resource('score', self.score, format_str="Score: {}")
         
         self.hud.update(dt)
     
@@ -62,10 +78,7 @@ class PlayingState(GameState):
         screen.fill((30, 50, 70))
         
         # Draw some game content
-        font = pygame.font.Font(None, 48)
-        text = font.render("Game is Running!", True, (255, 255, 255))
-        text_rect = text.get_rect(center=(self.config.screen_width // 2, self.config.screen_height // 2))
-        screen.blit(text, text_rect)
+        screen.blit(self._title_surface, self._title_rect)
         
         # Render HUD
         self.hud.render(screen)
@@ -5,10 +5,11 @@ This example demonstrates:
 1. Starting a server
 2. Connecting clients
 3. Spawning AI players
-4. Sending actions
+4. Sending actions (single and batched)
 5. Chat messaging
 """
 
+import asyncio
 import time
 import threading
 from tycoon_engine.networking.server import GameServer
@@ -33,16 +34,21 @@ def run_server():
     server.run()
 
 
-def run_client(player_name: str, delay: float = 0):
+async def run_client(player_name: str, delay: float = 0):
     """
     Run a game client.
     
+    Clients share one event loop; only the blocking connect/disconnect
+    handshakes are handed off to the default executor.
+    
     Args:
         player_name: Name for the player
         delay: Delay before connecting (seconds)
     """
+    loop = asyncio.get_running_loop()
+    
     if delay > 0:
-        time.sleep(delay)
+        await asyncio.sleep(delay)
     
     print(f"\n=== Starting Client: {player_name} ===")
     client = GameClient(host='localhost', port=5000)
@@ -73,33 +79,45 @@ def run_client(player_name: str, delay: float = 0):
     client.on_player_left = on_player_left
     
     # Connect to server
-    if client.connect(player_name=player_name):
+    if await loop.run_in_executor(None, client.connect, player_name):
         print(f"[{player_name}] Connected successfully!")
         
         # Perform some actions
-        time.sleep(1)
+        await asyncio.sleep(1)
         
-        # Send a game action
-        print(f"[{player_name}] Building a factory...")
-        client.send_action({
-            'type': 'update_entity',
-            'entity_id': f'factory_{player_name}',
-            'data': {
-                'owner': player_name,
-                'type': 'factory',
-                'level': 1,
-                'production': 10
+        # Send several game actions in one batch
+        print(f"[{player_name}] Building a factory and a warehouse...")
+        client.send_actions_batch([
+            {
+                'type': 'update_entity',
+                'entity_id': f'factory_{player_name}',
+                'data': {
+                    'owner': player_name,
+                    'type': 'factory',
+                    'level': 1,
+                    'production': 10
+                }
+            },
+            {
+                'type': 'update_entity',
+                'entity_id': f'warehouse_{player_name}',
+                'data': {
+                    'owner': player_name,
+                    'type': 'warehouse',
+                    'level': 1,
+                    'capacity': 100
+                }
             }
-        })
+        ])
         
-        time.sleep(1)
+        await asyncio.sleep(1)
         
         # Send a chat message
         print(f"[{player_name}] Sending chat message...")
         client.send_chat(f"Hello from {player_name}!")
         
         # Keep client running for a while
-        time.sleep(3)
+        await asyncio.sleep(3)
         
         # Send another action
         print(f"[{player_name}] Upgrading factory...")
@@ -114,16 +132,24 @@ def run_client(player_name: str, delay: float = 0):
             }
         })
         
-        time.sleep(2)
+        await asyncio.sleep(2)
         
         # Disconnect
         print(f"[{player_name}] Disconnecting...")
-        client.disconnect()
+        await loop.run_in_executor(None, client.disconnect)
         print(f"[{player_name}] Disconnected.")
     else:
         print(f"[{player_name}] Failed to connect to server.")
 
 
+async def run_clients():
+    """Run the demo clients concurrently."""
+    await asyncio.gather(
+        run_client("Player1", 1),
+        run_client("Player2", 2)
+    )
+
+
 def main():
     """Main entry point for multiplayer demo."""
     print("=" * 60)
@@ -137,24 +163,8 @@ def main():
     # Give server time to start
     time.sleep(1)
     
-    # Start multiple clients
-    client1_thread = threading.Thread(
-        target=run_client, 
-        args=("Player1", 1),
-        daemon=True
-    )
-    client2_thread = threading.Thread(
-        target=run_client, 
-        args=("Player2", 2),
-        daemon=True
-    )
-    
-    client1_thread.start()
-    client2_thread.start()
-    
-    # Wait for clients to finish
-    client1_thread.join()
-    client2_thread.join()
+    # Run multiple clients concurrently on a single event loop
+    asyncio.run(run_clients())
     
     print("\n" + "=" * 60)
     print("Demo completed!")
@@ -0,0 +1,67 @@
+"""
+Synchronization helpers for tests that wait on background threads.
+"""
+
+import queue
+import time
+from typing import Any, Callable, Optional
+
+
+def wait_for(predicate: Callable[[], bool], timeout: float = 2.0, interval: float = 0.005) -> bool:
+    """
+    Wait until a condition becomes true.
+    
+    Returns as soon as the predicate holds, so tests don't pay for a fixed
+    worst-case sleep.
+    
+    Args:
+        predicate: Function returning True once the condition is met
+        timeout: Maximum time to wait in seconds
+        interval: Time between checks in seconds
+        
+    Returns:
+        True if the condition was met, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if predicate():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def wait_for_message(
+    inbox: "queue.Queue",
+    kind: str,
+    predicate: Optional[Callable[[Any], bool]] = None,
+    timeout: float = 2.0
+) -> Any:
+    """
+    Take messages from an inbox until one of the given kind arrives.
+    
+    Messages are (kind, data) tuples. Messages that don't match are dropped.
+    
+    Args:
+        inbox: Queue the messages are delivered to
+        kind: Message kind to wait for
+        predicate: Optional extra condition on the message data
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        The data of the first matching message
+        
+    Raises:
+        AssertionError: If no matching message arrives in time
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise AssertionError(f"No '{kind}' message received within {timeout}s")
+        try:
+            message_kind, data = inbox.get(timeout=remaining)
+        except queue.Empty:
+            continue
+        if message_kind == kind and (predicate is None or predicate(data)):
+            return data
@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration.
+
+Selects SDL's dummy video and audio drivers before pygame is imported, so
+the suite runs headless (no window or sound device) and rendering calls
+stay cheap. Explicitly set drivers are left untouched.
+"""
+
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
@@ -28,15 +28,16 @@ def test_ai_player_with_resource_manager():
     assert ai.resource_manager.get_money() == 5000.0
 
 
-def test_ai_player_decision_interval():
+@pytest.mark.parametrize("difficulty,interval", [
+    ("easy", 5.0),
+    ("medium", 3.0),
+    ("hard", 1.5),
+])
+def test_ai_player_decision_interval(difficulty, interval):
     """Test decision interval based on difficulty."""
-    ai_easy = AIPlayer("ai_1", "Easy AI", difficulty="easy")
-    ai_medium = AIPlayer("ai_2", "Medium AI", difficulty="medium")
-    ai_hard = AIPlayer("ai_3", "Hard AI", difficulty="hard")
+    ai = AIPlayer("ai_1", "AI Player", difficulty=difficulty)
     
-    assert ai_easy._decision_interval == 5.0
-    assert ai_medium._decision_interval == 3.0
-    assert ai_hard._decision_interval == 1.5
+    assert ai._decision_interval == interval
 
 
 def test_ai_player_update_triggers_decision():
@@ -221,6 +222,23 @@ def test_ai_player_manager_get_all():
     assert len(all_players) == 2
     assert ai1 in all_players
     assert ai2 in all_players
+    
+    # Cached until the set of AI players changes
+    assert manager.get_all_ai_players() is all_players
+    manager.remove_ai_player("ai_1")
+    assert manager.get_all_ai_players() == (ai2,)
+
+
+def test_ai_player_manager_generate_id():
+    """Test generated AI player IDs are unique."""
+    manager = AIPlayerManager()
+    manager.add_ai_player(AIPlayer("ai_1", "Taken"))
+    
+    ids = [manager.generate_id() for _ in range(5)]
+    
+    assert len(set(ids)) == 5
+    assert all(player_id.startswith("ai_") for player_id in ids)
+    assert "ai_1" not in ids
 
 
 def test_ai_player_manager_update_all():
@@ -240,6 +258,159 @@ def test_ai_player_manager_update_all():
     assert ai2.decisions_made == 1
 
 
+def test_ai_player_manager_update_only_due_players():
+    """Test update_all only triggers AI players whose decision is due."""
+    manager = AIPlayerManager()
+    
+    easy = AIPlayer("easy", "Easy", difficulty="easy")    # 5 second interval
+    hard = AIPlayer("hard", "Hard", difficulty="hard")    # 1.5 second interval
+    manager.add_ai_player(easy)
+    manager.add_ai_player(hard)
+    
+    manager.update_all(1.5)
+    assert easy.decisions_made == 0
+    assert hard.decisions_made == 1
+    
+    # At most one decision per update, like AIPlayer.update
+    manager.update_all(3.5)
+    assert easy.decisions_made == 1
+    assert hard.decisions_made == 2
+    manager.update_all(0.0)
+    assert hard.decisions_made == 3
+
+
+def test_ai_player_manager_matches_individual_updates():
+    """Test update_all keeps the same timing as updating players directly."""
+    manager = AIPlayerManager()
+    managed = AIPlayer("managed", "Managed", difficulty="hard")
+    standalone = AIPlayer("standalone", "Standalone", difficulty="hard")
+    manager.add_ai_player(managed)
+    
+    for dt in [0.25, 0.5, 1.0, 0.1, 2.0, 0.75] * 5:
+        manager.update_all(dt)
+        standalone.update(dt)
+        assert managed.decisions_made == standalone.decisions_made
+
+
+def test_ai_player_manager_parallel_hooks():
+    """Test decisions of due AI players can run on a thread pool."""
+    manager = AIPlayerManager(parallel_hooks=True, max_workers=2)
+    seen_states = []
+    
+    for i in range(3):
+        ai = AIPlayer(f"ai_{i}", f"AI {i}", difficulty="hard")
+        ai.add_decision_hook(lambda state: seen_states.append(state) or {'type': 'build'})
+        manager.add_ai_player(ai)
+    
+    try:
+        manager.update_all(1.5, game_state={'tick': 1})
+    finally:
+        manager.shutdown()
+    
+    assert seen_states == [{'tick': 1}] * 3
+    for ai in manager.get_all_ai_players():
+        assert ai.decisions_made == 1
+        assert ai.actions_taken == 1
+    
+    # After shutdown, decisions run on the calling thread
+    manager.update_all(1.5)
+    assert all(ai.decisions_made == 2 for ai in manager.get_all_ai_players())
+
+
+def test_ai_player_manager_hook_removes_players():
+    """Test a decision hook can remove its own and other due AI players."""
+    manager = AIPlayerManager()
+    players = [AIPlayer(f"ai_{i}", f"AI {i}", difficulty="hard") for i in range(3)]
+    
+    def remove_players(state):
+        manager.remove_ai_player("ai_0")
+        manager.remove_ai_player("ai_1")
+    
+    players[0].add_decision_hook(remove_players)
+    for ai in players:
+        manager.add_ai_player(ai)
+    
+    manager.update_all(1.5)
+    assert manager.get_ai_player("ai_0") is None
+    assert manager.get_ai_player("ai_1") is None
+    # ai_1 was removed before its turn, so it didn't decide
+    assert players[1].decisions_made == 0
+    assert players[2].decisions_made == 1
+    
+    # Later updates keep working for the remaining player
+    manager.update_all(1.5)
+    manager.update_all(1.5)
+    assert players[0].decisions_made == 1
+    assert players[2].decisions_made == 3
+
+
+def test_ai_player_manager_removed_player_not_updated():
+    """Test removed AI players stop making decisions."""
+    manager = AIPlayerManager()
+    ai = AIPlayer("ai_1", "AI 1", difficulty="hard")
+    manager.add_ai_player(ai)
+    
+    manager.remove_ai_player("ai_1")
+    manager.update_all(2.0)
+    assert ai.decisions_made == 0
+    
+    # Re-adding schedules a fresh deadline from the current time
+    manager.add_ai_player(ai)
+    manager.update_all(1.0)
+    assert ai.decisions_made == 0
+    manager.update_all(0.5)
+    assert ai.decisions_made == 1
+
+
+def test_ai_player_manager_calls_overridden_update():
+    """Test AI players that override update() still have it called."""
+    class CountingAIPlayer(AIPlayer):
+        __slots__ = ('updates',)
+        
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.updates = []
+        
+        def update(self, dt, game_state=None, state_key=None):
+            self.updates.append((dt, game_state, state_key))
+            super().update(dt, game_state, state_key)
+    
+    manager = AIPlayerManager()
+    custom = CountingAIPlayer("ai_custom", "Custom", difficulty="hard")
+    plain = AIPlayer("ai_plain", "Plain", difficulty="hard")
+    manager.add_ai_player(custom)
+    manager.add_ai_player(plain)
+    
+    state = {'turn': 1}
+    manager.update_all(1.0, state, 'key')
+    manager.update_all(1.0, state, 'key')
+    assert custom.updates == [(1.0, state, 'key'), (1.0, state, 'key')]
+    assert custom.decisions_made == plain.decisions_made == 1
+    
+    manager.remove_ai_player("ai_custom")
+    manager.update_all(1.0)
+    assert len(custom.updates) == 2
+
+
+def test_ai_player_manager_keeps_player_timer():
+    """Test an AI player's progress towards a decision carries over the manager."""
+    ai = AIPlayer("ai_1", "AI 1", difficulty="hard")
+    ai.update(1.0)
+    
+    manager = AIPlayerManager()
+    manager.add_ai_player(ai)
+    manager.update_all(0.5)
+    assert ai.decisions_made == 1
+    
+    # Removing hands the remaining time back to the player
+    manager.update_all(1.0)
+    manager.remove_ai_player("ai_1")
+    ai.update(0.4)
+    assert ai.decisions_made == 1
+    ai.update(0.1)
+    assert ai.decisions_made == 2
+
+
 def test_ai_player_manager_statistics():
     """Test manager statistics aggregation."""
     manager = AIPlayerManager()
@@ -278,6 +449,30 @@ def test_ai_player_manager_clear():
     assert len(manager.get_all_ai_players()) == 0
 
 
+def test_ai_player_state_key_reuses_hook_actions():
+    """Test decisions with an unchanged state_key skip the hooks."""
+    ai = AIPlayer("ai_1", "AI Player", difficulty="hard")
+    calls = []
+    
+    def hook(game_state):
+        calls.append(game_state)
+        return {'type': 'build', 'cost': 0}
+    
+    ai.add_decision_hook(hook)
+    
+    ai._make_decision({'day': 1}, state_key=1)
+    ai._make_decision({'day': 1}, state_key=1)
+    assert len(calls) == 1
+    assert ai.decisions_made == 2
+    assert len(ai._action_queue) == 2
+    assert ai._action_queue[0] is not ai._action_queue[1]
+    
+    # A new key, or no key at all, calls the hooks again
+    ai._make_decision({'day': 2}, state_key=2)
+    ai._make_decision({'day': 2})
+    assert len(calls) == 3
+
+
 def test_ai_player_state_transitions():
     """Test AI player state transitions."""
     ai = AIPlayer("ai_1", "AI Player", difficulty="medium")
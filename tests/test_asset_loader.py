@@ -109,6 +109,21 @@ def test_cache_info(asset_loader):
     assert info['fonts'] == 1
 
 
+def test_font_cache_is_bounded(temp_dir, monkeypatch):
+    """Test least recently used fonts are evicted from the font cache."""
+    monkeypatch.setattr("tycoon_engine.utils.asset_loader.FONT_CACHE_SIZE", 2)
+    pygame.init()
+    loader = AssetLoader(temp_dir)
+    
+    font_24 = loader.load_font(None, 24)
+    loader.load_font(None, 32)
+    assert loader.load_font(None, 24) is font_24  # 24 is now most recent
+    loader.load_font(None, 48)  # evicts 32
+    
+    assert loader.get_cache_info()['fonts'] == 2
+    assert loader.load_font(None, 24) is font_24
+
+
 def test_clear_cache(asset_loader):
     """Test clearing cache."""
     # Load some assets
@@ -180,3 +195,30 @@ def test_cache_key_with_scale(asset_loader, temp_dir):
     # Should be different cached objects
     assert img1.get_size() == (50, 50)
     assert img2.get_size() == (100, 100)
+
+
+def test_preload_images(asset_loader, temp_dir, capsys):
+    """Test preloading images reads files and caches converted surfaces."""
+    pygame.display.set_mode((100, 100))
+    for name in ("a.png", "b.png"):
+        pygame.image.save(pygame.Surface((10, 10)), str(Path(temp_dir) / name))
+    
+    asset_loader.preload_assets(images=["a.png", "b.png", "missing.png"])
+    
+    assert asset_loader.get_cache_info()['images'] == 2
+    assert asset_loader.load_image("a.png").get_size() == (10, 10)
+    assert "Could not preload image missing.png" in capsys.readouterr().out
+
+
+def test_preload_unreadable_file_warns(asset_loader, temp_dir, capsys):
+    """Test a file that can't be read is reported without stopping the preload."""
+    pygame.display.set_mode((100, 100))
+    pygame.image.save(pygame.Surface((10, 10)), str(Path(temp_dir) / "a.png"))
+    (Path(temp_dir) / "folder.png").mkdir()
+    
+    asset_loader.preload_assets(images=["folder.png", "a.png"], sounds=["folder.png"])
+    
+    assert asset_loader.get_cache_info()['images'] == 1
+    out = capsys.readouterr().out
+    assert "Could not preload image folder.png" in out
+    assert "Could not preload sound folder.png" in out
@@ -2,6 +2,7 @@
 Tests for economy system.
 """
 
+import dataclasses
 import pytest
 from tycoon_engine.entities.resources import ResourceManager
 from tycoon_engine.systems.economy import EconomySystem, EconomyConfig
@@ -25,6 +26,27 @@ def test_economy_config_custom_params():
     assert config.get_custom_param("nonexistent", "default") == "default"
 
 
+def test_economy_config_is_immutable():
+    """Test economy config rates are changed by replacing the config."""
+    rm = ResourceManager(starting_money=1000.0)
+    config = EconomyConfig(
+        base_income_rate=100.0,
+        base_expense_rate=0.0,
+        tax_rate=0.0,
+        interest_rate=0.0
+    )
+    economy = EconomySystem(rm, config)
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.tax_rate = 0.5
+    
+    economy.config = dataclasses.replace(config, tax_rate=0.5)
+    economy.update(1.0)
+    
+    assert economy.config.tax_rate == 0.5
+    assert rm.get_money() == 1000.0 + 50.0
+
+
 def test_economy_system_initialization():
     """Test economy system initialization."""
     rm = ResourceManager(starting_money=1000.0)
@@ -130,6 +152,30 @@ def test_economy_system_interest():
     assert rm.get_money() == 1000.0 + 100.0
 
 
+def test_economy_system_interest_compounds_across_batched_ticks():
+    """Test several ticks in one update compound like separate updates."""
+    config = EconomyConfig(
+        base_income_rate=100.0,
+        base_expense_rate=30.0,
+        tax_rate=0.1,
+        interest_rate=0.05,
+        tick_interval=1.0
+    )
+    batched_rm = ResourceManager(starting_money=1000.0)
+    batched = EconomySystem(batched_rm, config)
+    stepped_rm = ResourceManager(starting_money=1000.0)
+    stepped = EconomySystem(stepped_rm, config)
+    
+    batched.update(5.0)
+    for _ in range(5):
+        stepped.update(1.0)
+    
+    assert batched.tick_count == stepped.tick_count == 5
+    assert batched_rm.get_money() == pytest.approx(stepped_rm.get_money())
+    assert batched.total_income == pytest.approx(stepped.total_income)
+    assert batched.total_expenses == pytest.approx(stepped.total_expenses)
+
+
 def test_economy_system_income_modifier():
     """Test income modifier functionality."""
     rm = ResourceManager(starting_money=1000.0)
@@ -176,6 +222,46 @@ def test_economy_system_expense_modifier():
     assert rm.get_money() == 1000.0
 
 
+def test_economy_system_modifiers_evaluated_once_per_update():
+    """Test modifiers run once per update, however many ticks elapse."""
+    rm = ResourceManager(starting_money=1000.0)
+    config = EconomyConfig(
+        base_income_rate=100.0,
+        base_expense_rate=50.0,
+        tax_rate=0.0,
+        interest_rate=0.0,
+        tick_interval=1.0
+    )
+    economy = EconomySystem(rm, config)
+    calls = []
+    
+    def double_income(income):
+        calls.append(income)
+        return income * 2.0
+    
+    expense_calls = []
+    
+    def count_expenses(expenses):
+        expense_calls.append(expenses)
+        return expenses
+    
+    economy.add_income_modifier(double_income)
+    economy.add_expense_modifier(count_expenses)
+    economy.update(3.0)
+    
+    assert len(calls) == 1
+    assert len(expense_calls) == 1
+    assert economy.tick_count == 3
+    assert rm.get_money() == 1000.0 + 3 * (200.0 - 50.0)
+    
+    # Frames that end between ticks don't call the modifiers at all
+    economy.update(0.5)
+    assert len(calls) == 1
+    economy.update(0.5)
+    assert len(calls) == 2
+    assert len(expense_calls) == 2
+
+
 def test_economy_system_remove_modifiers():
     """Test removing modifiers."""
     rm = ResourceManager(starting_money=1000.0)
@@ -195,6 +281,32 @@ def test_economy_system_remove_modifiers():
     assert economy.remove_expense_modifier(modifier) is False
 
 
+def test_economy_system_modifier_order_and_duplicates():
+    """Test modifiers apply in insertion order and register only once."""
+    rm = ResourceManager(starting_money=0.0)
+    config = EconomyConfig(
+        base_income_rate=10.0,
+        base_expense_rate=0.0,
+        tax_rate=0.0,
+        interest_rate=0.0
+    )
+    economy = EconomySystem(rm, config)
+    
+    def add_five(income):
+        return income + 5.0
+    
+    def double(income):
+        return income * 2.0
+    
+    economy.add_income_modifier(add_five)
+    economy.add_income_modifier(double)
+    economy.add_income_modifier(add_five)  # already registered
+    assert economy.get_net_income_rate() == (10.0 + 5.0) * 2.0
+    
+    economy.remove_income_modifier(add_five)
+    assert economy.get_net_income_rate() == 20.0
+
+
 def test_economy_system_net_income_rate():
     """Test net income rate calculation."""
     rm = ResourceManager(starting_money=1000.0)
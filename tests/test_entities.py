@@ -74,6 +74,52 @@ def test_entity_manager():
     assert manager.get_entity("e1") is None
 
 
+def test_entity_manager_type_index():
+    """Test get_entities_by_type stays in sync with adds and removals."""
+    manager = EntityManager()
+    
+    stand = Entity("e1", "stand", 0, 0)
+    kiosk = Entity("e2", "stand", 0, 0)
+    worker = Entity("e3", "worker", 0, 0)
+    for entity in (stand, kiosk, worker):
+        manager.add_entity(entity)
+    
+    assert manager.get_entities_by_type("stand") == [stand, kiosk]
+    assert manager.get_entities_by_type("missing") == []
+    
+    manager.remove_entity("e1")
+    assert manager.get_entities_by_type("stand") == [kiosk]
+    
+    # Re-adding an ID files the new entity under its own type
+    replacement = Entity("e2", "worker", 0, 0)
+    manager.add_entity(replacement)
+    assert manager.get_entities_by_type("stand") == []
+    assert manager.get_entities_by_type("worker") == [worker, replacement]
+    
+    manager.clear()
+    assert manager.get_entities_by_type("worker") == []
+
+
+def test_entity_type_change_updates_index():
+    """Test reassigning an entity's type moves it to the new type bucket."""
+    manager = EntityManager()
+    stand = Entity("e1", "stand", 0, 0)
+    kiosk = Entity("e2", "stand", 0, 0)
+    manager.add_entity(stand)
+    manager.add_entity(kiosk)
+    
+    stand.type = "worker"
+    assert stand.type == "worker"
+    assert manager.get_entities_by_type("stand") == [kiosk]
+    assert manager.get_entities_by_type("worker") == [stand]
+    
+    assert manager.remove_entity("e1") is True
+    assert manager.get_entities_by_type("worker") == []
+    
+    # Entities no longer managed can change type freely
+    stand.type = "stand"
+    assert manager.get_entities_by_type("stand") == [kiosk]
+
 def test_entity_manager_max_entities():
     """Test entity manager max entities limit."""
     manager = EntityManager(max_entities=2)
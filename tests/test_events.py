@@ -89,6 +89,22 @@ def test_event_priority(dispatcher):
     assert call_order == ['high', 'normal', 'low']
 
 
+def test_event_priority_keeps_subscription_order(dispatcher):
+    """Test listeners with equal priority run in subscription order."""
+    call_order = []
+    
+    dispatcher.subscribe('tick', lambda e: call_order.append('first'))
+    dispatcher.subscribe('tick', lambda e: call_order.append('critical'), EventPriority.CRITICAL)
+    dispatcher.subscribe('tick', lambda e: call_order.append('second'))
+    dispatcher.subscribe('tick', lambda e: call_order.append('low'), EventPriority.LOW)
+    dispatcher.subscribe('tick', lambda e: call_order.append('third'))
+    
+    dispatcher.dispatch_custom_event('tick')
+    dispatcher.process_custom_events()
+    
+    assert call_order == ['critical', 'first', 'second', 'third', 'low']
+
+
 def test_unsubscribe(dispatcher):
     """Test unsubscribing from events."""
     called = {'value': False}
@@ -106,6 +122,21 @@ def test_unsubscribe(dispatcher):
     assert not called['value']
 
 
+def test_unsubscribe_last_listener(dispatcher):
+    """Test has_listeners is False once the last listener is removed."""
+    def callback(event):
+        pass
+    
+    dispatcher.subscribe('custom_event', callback)
+    dispatcher.unsubscribe('custom_event', callback)
+    dispatcher.unsubscribe(pygame.KEYDOWN, callback)  # never subscribed
+    
+    assert not dispatcher.has_listeners('custom_event')
+    assert not dispatcher.has_listeners(pygame.KEYDOWN)
+    assert len(dispatcher._pygame_listeners) == 0
+    assert len(dispatcher._custom_listeners) == 0
+
+
 def test_clear_all(dispatcher):
     """Test clearing all listeners."""
     def callback(event):
@@ -200,3 +231,24 @@ def test_on_mouse_click_helper(dispatcher):
     event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0))
     dispatcher.dispatch_pygame_event(event)
     # The filter checks button, so this should work
+
+
+def test_key_listeners_only_see_their_key(dispatcher):
+    """Test key-specific listeners interleave with KEYDOWN listeners by priority."""
+    calls = []
+    
+    space_filter = on_key_down(dispatcher, pygame.K_SPACE, lambda e: calls.append('space'))
+    dispatcher.subscribe_key(pygame.K_a, lambda e: calls.append('a'), EventPriority.HIGH)
+    dispatcher.subscribe(pygame.KEYDOWN, lambda e: calls.append('any'), EventPriority.LOW)
+    
+    dispatcher.dispatch_pygame_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+    dispatcher.dispatch_pygame_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+    assert calls == ['space', 'any', 'a', 'any']
+    
+    calls.clear()
+    dispatcher.unsubscribe(pygame.KEYDOWN, space_filter)
+    dispatcher.dispatch_pygame_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+    assert calls == ['any']
+    
+    dispatcher.clear_event_type(pygame.KEYDOWN)
+    assert not dispatcher.has_listeners(pygame.KEYDOWN)
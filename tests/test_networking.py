@@ -1,47 +1,114 @@
 """Tests for networking module."""
 
 import pytest
-import time
+import queue
+import socket
 import threading
-from tycoon_engine.networking.server import GameServer
+from tycoon_engine.networking.server import GameServer, MAX_BATCH_ACTIONS
 from tycoon_engine.networking.client import GameClient
+from tests._sync import wait_for, wait_for_message
+
+
+def find_free_port() -> int:
+    """Ask the OS for a port that is currently free on localhost."""
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
 
 
 @pytest.fixture
-def server():
-    """Create a test server instance."""
-    server = GameServer(host='localhost', port=5001)
+def free_port():
+    """Provide a free localhost port."""
+    return find_free_port()
+
+
+@pytest.fixture(scope="session")
+def running_server():
+    """Start one test server for the whole test session."""
+    server = GameServer(host='localhost', port=find_free_port())
     # Run server in a separate thread
     server_thread = threading.Thread(target=server.run, daemon=True)
     server_thread.start()
-    time.sleep(0.5)  # Give server time to start
+    assert server.ready.wait(timeout=5), "Test server did not start"
     yield server
-    # Server will be cleaned up when test ends
+    # Server thread is a daemon and stops with the test session
+
+
+@pytest.fixture
+def server(running_server):
+    """Provide the shared test server with its game state reset."""
+    running_server.game_state['entities'].clear()
+    running_server.game_state['resources'].clear()
+    running_server.game_state['tick'] = 0
+    for ai_id in list(running_server.ai_players):
+        running_server.remove_ai_player(ai_id)
+    return running_server
+
+
+@pytest.fixture(scope="session")
+def pooled_client(running_server):
+    """Connect and join one client that tests share for the whole session."""
+    client = GameClient(host='localhost', port=running_server.port)
+    assert client.connect(player_name="PooledPlayer") is True
+    assert wait_for(lambda: any(
+        player['player_name'] == "PooledPlayer"
+        for player in list(running_server.game_state['players'].values())
+    ))
+    yield client
+    client.disconnect()
+
+
+@pytest.fixture
+def client(server, pooled_client):
+    """Provide the shared connected client with its callbacks cleared."""
+    pooled_client.on_state_update = None
+    pooled_client.on_chat_message = None
+    pooled_client.on_player_joined = None
+    pooled_client.on_player_left = None
+    return pooled_client
+
+
+@pytest.fixture
+def fresh_client(running_server):
+    """Create a new, unconnected client for tests of the connection itself."""
+    client = GameClient(host='localhost', port=running_server.port)
+    yield client
+    client.disconnect()
+
+
+def make_inbox(client: GameClient) -> "queue.Queue":
+    """Route every message a client receives into a queue of (kind, data) tuples."""
+    inbox = queue.Queue()
+    client.on_state_update = lambda data: inbox.put(('state', data))
+    client.on_chat_message = lambda data: inbox.put(('chat', data))
+    client.on_player_joined = lambda data: inbox.put(('joined', data))
+    client.on_player_left = lambda data: inbox.put(('left', data))
+    return inbox
 
 
 @pytest.fixture
-def client():
-    """Create a test client instance."""
-    return GameClient(host='localhost', port=5001)
+def inbox(client):
+    """Queue receiving every message delivered to the test client."""
+    return make_inbox(client)
 
 
 class TestGameServer:
     """Test GameServer functionality."""
     
-    def test_server_initialization(self):
+    def test_server_initialization(self, free_port):
         """Test server initializes correctly."""
-        server = GameServer(host='localhost', port=5002)
+        server = GameServer(host='localhost', port=free_port)
         assert server.host == 'localhost'
-        assert server.port == 5002
+        assert server.port == free_port
         assert server.game_state is not None
         assert 'entities' in server.game_state
         assert 'resources' in server.game_state
         assert 'players' in server.game_state
         assert 'tick' in server.game_state
     
-    def test_spawn_ai_player(self):
+    def test_spawn_ai_player(self, free_port):
         """Test spawning AI players."""
-        server = GameServer(host='localhost', port=5003)
+        server = GameServer(host='localhost', port=free_port)
         
         # Spawn AI player with default name
         ai_id1 = server.spawn_ai_player()
@@ -55,9 +122,9 @@ class TestGameServer:
         assert server.ai_players[ai_id2]['player_name'] == "TestBot"
         assert server.game_state['players'][ai_id2]['is_ai'] is True
     
-    def test_remove_ai_player(self):
+    def test_remove_ai_player(self, free_port):
         """Test removing AI players."""
-        server = GameServer(host='localhost', port=5004)
+        server = GameServer(host='localhost', port=free_port)
         
         # Spawn and remove AI player
         ai_id = server.spawn_ai_player()
@@ -72,17 +139,41 @@ class TestGameServer:
         result = server.remove_ai_player('non_existent')
         assert result is False
     
-    def test_game_state_update(self):
+    def test_game_state_update(self, free_port):
         """Test game state updates."""
-        server = GameServer(host='localhost', port=5005)
+        server = GameServer(host='localhost', port=free_port)
         
         initial_tick = server.game_state['tick']
         server.update_state({'tick': initial_tick + 1})
         assert server.game_state['tick'] == initial_tick + 1
     
-    def test_process_action(self):
+    def test_update_state_sends_deltas(self, free_port):
+        """Test update_state broadcasts only changed keys between full snapshots."""
+        server = GameServer(host='localhost', port=free_port, full_state_interval=3)
+        emitted = []
+        server.sio.emit = lambda event, data, room=None: emitted.append((event, dict(data)))
+        
+        server.update_state({'tick': 1, 'resources': {}})
+        assert emitted == [('state_delta', {'changes': {'tick': 1}})]
+        
+        # Nothing changed, nothing sent
+        server.update_state({'tick': 1})
+        assert len(emitted) == 1
+        
+        # The same object is assumed to have been modified in place
+        server.game_state['entities']['farm'] = {'level': 1}
+        server.update_state({'entities': server.game_state['entities']})
+        assert emitted[-1] == ('state_delta', {'changes': {'entities': {'farm': {'level': 1}}}})
+        
+        # Every full_state_interval deltas the full state is sent
+        server.update_state({'tick': 2})
+        assert emitted[-1] == ('game_state', server.game_state)
+        server.update_state({'tick': 3})
+        assert emitted[-1] == ('state_delta', {'changes': {'tick': 3}})
+    
+    def test_process_action(self, free_port):
         """Test action processing."""
-        server = GameServer(host='localhost', port=5006)
+        server = GameServer(host='localhost', port=free_port)
         
         # Test update_entity action
         action = {
@@ -101,174 +192,169 @@ class TestGameServer:
         }
         server._process_action('player_1', action)
         assert 'building_1' not in server.game_state['entities']
+    
+    def test_process_batch_action(self, free_port):
+        """Test batched actions are applied in order."""
+        server = GameServer(host='localhost', port=free_port)
+        
+        action = {
+            'type': 'batch',
+            'actions': [
+                {'type': 'update_entity', 'entity_id': 'factory', 'data': {'level': 1}},
+                {'type': 'update_entity', 'entity_id': 'factory', 'data': {'level': 2}},
+                {'type': 'update_entity', 'entity_id': 'shop', 'data': {'level': 1}},
+                {'type': 'remove_entity', 'entity_id': 'shop'},
+                {'type': 'batch', 'actions': [
+                    {'type': 'update_entity', 'entity_id': 'nested', 'data': {'level': 1}}
+                ]},
+                'not an action',
+            ]
+        }
+        server._process_action('player_1', action)
+        
+        assert server.game_state['entities'] == {'factory': {'level': 2}}
+        assert server.game_state['tick'] == 4
+    
+    def test_oversized_batch_rejected(self, free_port):
+        """Test batches over MAX_BATCH_ACTIONS are rejected with an error."""
+        server = GameServer(host='localhost', port=free_port)
+        emitted = []
+        server.sio.emit = lambda event, data, room=None: emitted.append((event, data, room))
+        
+        update = {'type': 'update_entity', 'entity_id': 'factory', 'data': {'level': 1}}
+        server._process_action('player_1', {
+            'type': 'batch',
+            'actions': [update] * (MAX_BATCH_ACTIONS + 1)
+        })
+        assert server.game_state['entities'] == {}
+        assert server.game_state['tick'] == 0
+        assert [(event, room) for event, _, room in emitted] == [('action_error', 'player_1')]
+        
+        server._process_action('player_1', {
+            'type': 'batch',
+            'actions': [update] * MAX_BATCH_ACTIONS
+        })
+        assert server.game_state['tick'] == MAX_BATCH_ACTIONS
+        assert len(emitted) == 1
 
 
 class TestGameClient:
     """Test GameClient functionality."""
     
-    def test_client_initialization(self):
+    def test_client_initialization(self, free_port):
         """Test client initializes correctly."""
-        client = GameClient(host='localhost', port=5007)
+        client = GameClient(host='localhost', port=free_port)
         assert client.host == 'localhost'
-        assert client.port == 5007
-        assert client.url == 'http://localhost:5007'
+        assert client.port == free_port
+        assert client.url == f'http://localhost:{free_port}'
         assert client.connected is False
     
-    def test_client_connection(self, server, client):
+    def test_msgpack_serializer(self, free_port):
+        """Test server and client can be configured to use msgpack."""
+        pytest.importorskip('msgpack')
+        from socketio.msgpack_packet import MsgPackPacket
+        
+        server = GameServer(host='localhost', port=free_port, serializer='msgpack')
+        client = GameClient(host='localhost', port=free_port, serializer='msgpack')
+        assert server.sio.packet_class is MsgPackPacket
+        assert client.sio.packet_class is MsgPackPacket
+    
+    def test_client_connection(self, server, fresh_client):
         """Test client can connect to server."""
-        success = client.connect(player_name="TestPlayer")
+        success = fresh_client.connect(player_name="TestPlayer")
         assert success is True
-        time.sleep(0.2)  # Wait for connection to establish
-        assert client.connected is True
-        assert client.player_name == "TestPlayer"
-        client.disconnect()
+        assert wait_for(lambda: fresh_client.connected)
+        assert fresh_client.player_name == "TestPlayer"
     
-    def test_client_join(self, server, client):
+    def test_client_join(self, server, fresh_client):
         """Test client join functionality."""
-        client.connect()
-        time.sleep(0.2)
-        client.join("JoinTestPlayer")
-        time.sleep(0.2)
-        assert client.player_name == "JoinTestPlayer"
-        client.disconnect()
+        fresh_client.connect()
+        assert wait_for(lambda: fresh_client.connected)
+        fresh_client.join("JoinTestPlayer")
+        assert fresh_client.player_name == "JoinTestPlayer"
+        assert wait_for(lambda: any(
+            player['player_name'] == "JoinTestPlayer"
+            for player in list(server.game_state['players'].values())
+        ))
     
     def test_client_send_action(self, server, client):
         """Test client can send actions."""
-        client.connect(player_name="ActionPlayer")
-        time.sleep(0.5)  # Increased wait time
-        
         action = {
             'type': 'update_entity',
             'entity_id': 'test_entity',
             'data': {'value': 42}
         }
         client.send_action(action)
-        time.sleep(0.5)  # Increased wait time
         
         # Verify action was received and processed
-        assert 'test_entity' in server.game_state['entities']
+        assert wait_for(lambda: 'test_entity' in server.game_state['entities'])
         assert server.game_state['entities']['test_entity']['value'] == 42
-        
-        client.disconnect()
     
-    def test_client_send_chat(self, server, client):
+    def test_client_send_chat(self, server, client, inbox):
         """Test client can send chat messages."""
-        received_messages = []
-        
-        def on_chat(data):
-            received_messages.append(data)
-        
-        client.on_chat_message = on_chat
-        client.connect(player_name="ChatPlayer")
-        time.sleep(0.2)
-        
         client.send_chat("Hello, world!")
-        time.sleep(0.2)
-        
-        assert len(received_messages) > 0
-        assert received_messages[0]['message'] == "Hello, world!"
         
-        client.disconnect()
+        message = wait_for_message(inbox, 'chat', lambda data: data['message'] == "Hello, world!")
+        assert message['player_id'] == client.sio.get_sid()
     
-    def test_client_callbacks(self, server, client):
+    def test_client_callbacks(self, server, client, inbox):
         """Test client event callbacks."""
-        state_updates = []
-        player_joins = []
-        player_leaves = []
-        
-        def on_state(data):
-            state_updates.append(data)
-        
-        def on_join(data):
-            player_joins.append(data)
-        
-        def on_leave(data):
-            player_leaves.append(data)
-        
-        client.on_state_update = on_state
-        client.on_player_joined = on_join
-        client.on_player_left = on_leave
-        
-        client.connect(player_name="CallbackPlayer")
-        time.sleep(0.2)
-        
-        # Should receive initial state
-        assert len(state_updates) > 0
-        
         # Spawn AI player to trigger player_joined event
-        server.spawn_ai_player("TestAI")
-        time.sleep(0.2)
+        ai_id = server.spawn_ai_player("TestAI")
         
-        # Should receive player joined event
-        assert len(player_joins) > 0
+        # Should receive player joined event, then the updated state
+        joined = wait_for_message(inbox, 'joined', lambda data: data['player_id'] == ai_id)
+        assert joined['player_name'] == "TestAI"
+        assert joined['is_ai'] is True
+        wait_for_message(inbox, 'state', lambda data: ai_id in data['players'])
         
-        client.disconnect()
+        # Removing it triggers player_left
+        server.remove_ai_player(ai_id)
+        wait_for_message(inbox, 'left', lambda data: data['player_id'] == ai_id)
     
-    def test_client_disconnect(self, server, client):
+    def test_client_disconnect(self, server, fresh_client):
         """Test client disconnect."""
-        client.connect(player_name="DisconnectPlayer")
-        time.sleep(0.2)
-        assert client.connected is True
+        fresh_client.connect(player_name="DisconnectPlayer")
+        assert wait_for(lambda: fresh_client.connected)
         
-        client.disconnect()
-        time.sleep(0.2)
-        assert client.connected is False
+        fresh_client.disconnect()
+        assert wait_for(lambda: not fresh_client.connected)
 
 
 class TestMultiplayerProtocol:
     """Test multiplayer protocol message types."""
     
-    def test_join_message(self, server, client):
+    def test_join_message(self, server, fresh_client):
         """Test join message protocol."""
-        success = client.connect(player_name="ProtocolPlayer")
-        time.sleep(0.5)  # Increased wait time
+        success = fresh_client.connect(player_name="ProtocolPlayer")
+        assert success is True
         
-        # Only proceed if connection was successful
-        if not success:
-            pytest.skip("Connection failed - server may be busy")
+        def find_player():
+            for player_data in list(server.game_state['players'].values()):
+                if player_data['player_name'] == "ProtocolPlayer":
+                    return player_data
+            return None
         
         # Verify player is in server's game state
-        player_found = False
-        for player_id, player_data in server.game_state['players'].items():
-            if player_data['player_name'] == "ProtocolPlayer":
-                player_found = True
-                assert player_data['is_ai'] is False
-                break
-        
-        assert player_found is True
-        client.disconnect()
+        assert wait_for(lambda: find_player() is not None)
+        assert find_player()['is_ai'] is False
     
-    def test_state_update_message(self, server, client):
+    def test_state_update_message(self, server, client, inbox):
         """Test state_update message protocol."""
-        state_updates = []
-        client.on_state_update = lambda data: state_updates.append(data)
-        
-        success = client.connect(player_name="StatePlayer")
-        if not success:
-            pytest.skip("Connection failed - server may be busy")
-        
-        time.sleep(0.5)  # Increased wait time
-        
-        # Should have received initial state update
-        assert len(state_updates) > 0
-        
-        # Trigger another state update
+        # Trigger a state update
         server.update_state({'custom_field': 'test_value'})
-        time.sleep(0.5)  # Increased wait time
-        
-        # Verify state update received with custom field
-        assert state_updates[-1].get('custom_field') == 'test_value'
         
-        client.disconnect()
+        # Verify state update received with custom field, merged into the
+        # state the client already had
+        state = wait_for_message(
+            inbox, 'state', lambda data: data.get('custom_field') == 'test_value'
+        )
+        assert client.sio.get_sid() in state['players']
+        assert client.game_state == state
+        server.game_state.pop('custom_field', None)
     
     def test_player_action_message(self, server, client):
         """Test player_action message protocol."""
-        success = client.connect(player_name="ActionProtocolPlayer")
-        if not success:
-            pytest.skip("Connection failed - server may be busy")
-        
-        time.sleep(0.5)  # Increased wait time
-        
         # Send player action
         action = {
             'type': 'update_entity',
@@ -276,54 +362,37 @@ class TestMultiplayerProtocol:
             'data': {'test': 'data'}
         }
         client.send_action(action)
-        time.sleep(0.5)  # Increased wait time
         
         # Verify action was processed
-        assert 'protocol_test' in server.game_state['entities']
-        
-        client.disconnect()
+        assert wait_for(lambda: 'protocol_test' in server.game_state['entities'])
     
-    def test_chat_message(self, server, client):
+    def test_chat_message(self, server, client, inbox):
         """Test chat message protocol."""
-        chat_messages = []
-        client.on_chat_message = lambda data: chat_messages.append(data)
-        
-        success = client.connect(player_name="ChatProtocolPlayer")
-        if not success:
-            pytest.skip("Connection failed - server may be busy")
-        
-        time.sleep(0.5)  # Increased wait time
-        
         # Send chat message
         client.send_chat("Protocol test message")
-        time.sleep(0.5)  # Increased wait time
         
         # Verify chat message received
-        assert len(chat_messages) > 0
-        assert chat_messages[0]['message'] == "Protocol test message"
-        
-        client.disconnect()
+        message = wait_for_message(
+            inbox, 'chat', lambda data: data['message'] == "Protocol test message"
+        )
+        assert isinstance(message['timestamp'], float)
     
-    def test_disconnect_message(self, server, client):
+    def test_disconnect_message(self, server, client, fresh_client):
         """Test disconnect message protocol."""
-        player_leaves = []
-        client.on_player_left = lambda data: player_leaves.append(data)
-        
-        client.connect(player_name="DisconnectProtocolPlayer")
-        time.sleep(0.2)
-        
-        # Create second client to observe disconnection
-        client2 = GameClient(host='localhost', port=5001)
-        client2.on_player_left = lambda data: player_leaves.append(data)
-        client2.connect(player_name="Observer")
-        time.sleep(0.2)
-        
-        # Disconnect first client
-        client.disconnect()
-        time.sleep(0.2)
-        
-        # Second client should receive player_left event
-        # Note: This might not work as expected due to event scoping
-        # but demonstrates the protocol
-        
-        client2.disconnect()
+        # The shared client observes the disconnection
+        observer_inbox = make_inbox(client)
+        fresh_client.connect(player_name="DisconnectProtocolPlayer")
+        assert wait_for(lambda: any(
+            player['player_name'] == "DisconnectProtocolPlayer"
+            for player in list(server.game_state['players'].values())
+        ))
+        
+        # Disconnect the new client
+        fresh_client.disconnect()
+        
+        # Shared client should receive player_left event
+        left = wait_for_message(
+            observer_inbox, 'left',
+            lambda data: data['player_name'] == "DisconnectProtocolPlayer"
+        )
+        assert left['is_ai'] is False
@@ -32,6 +32,40 @@ def test_remove_money():
     assert rm.get_money() == 50.0
 
 
+def test_money_is_exact():
+    """Test many small transactions don't accumulate rounding error."""
+    rm = ResourceManager(starting_money=0.0)
+    for _ in range(1000):
+        rm.add_money(0.1)
+    assert rm.get_money() == 100.0
+    
+    for _ in range(1000):
+        assert rm.remove_money(0.1) is True
+    assert rm.get_money() == 0.0
+    assert rm.can_afford(0.0) is True
+    assert rm.can_afford(0.01) is False
+    
+    rm.money = 12.5
+    assert rm.get_money() == 12.5
+
+
+@pytest.mark.parametrize("amount", [float('inf'), float('-inf'), float('nan')])
+def test_money_must_be_finite(amount):
+    """Test non-finite amounts are rejected without touching the balance."""
+    rm = ResourceManager(starting_money=100.0)
+    with pytest.raises(ValueError):
+        rm.add_money(amount)
+    with pytest.raises(ValueError):
+        rm.remove_money(amount)
+    with pytest.raises(ValueError):
+        rm.can_afford(amount)
+    with pytest.raises(ValueError):
+        rm.money = amount
+    with pytest.raises(ValueError):
+        ResourceManager(starting_money=amount)
+    assert rm.get_money() == 100.0
+
+
 def test_can_afford():
     """Test can_afford check."""
     rm = ResourceManager(starting_money=100.0)
@@ -15,18 +15,18 @@ from tycoon_engine.ui.components import (
 )
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def init_pygame():
-    """Initialize pygame for all tests."""
+    """Initialize pygame once for all tests."""
     pygame.init()
     yield
     # No explicit cleanup needed
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def screen():
-    """Create a test screen surface."""
-    return pygame.display.set_mode((800, 600))
+    """Create a test screen surface (an off-screen render target, no window)."""
+    return pygame.Surface((800, 600))
 
 
 def test_ui_component_creation():
@@ -110,14 +110,26 @@ def test_button_click(screen):
         pos=(150, 125)  # Inside button
     )
     
-    # Mock mouse position
-    pygame.mouse.get_pos = lambda: (150, 125)
-    
     handled = button.handle_event(event)
     assert handled is True
     assert called['value'] is True
 
 
+def test_button_click_outside():
+    """Test clicks are hit-tested at the event position."""
+    called = {'value': False}
+    
+    def callback():
+        called['value'] = True
+    
+    button = Button("Click", 100, 100, 100, 50, callback=callback)
+    
+    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 10))
+    
+    assert button.handle_event(event) is False
+    assert called['value'] is False
+
+
 def test_button_set_text():
     """Test updating button text."""
     button = Button("Initial", 0, 0, 100, 50)
@@ -215,13 +227,24 @@ def test_text_input_backspace():
     assert text_input.get_text() == "Hell"
 
 
+def test_text_input_render_reuses_text_surface(screen):
+    """Test text input only re-renders its text when the text changes."""
+    text_input = TextInput(0, 0, 200, 40, initial_text="Hello")
+    
+    text_input.render(screen)
+    surface = text_input._text_surface
+    text_input.render(screen)
+    assert text_input._text_surface is surface
+    
+    text_input.set_text("World")
+    text_input.render(screen)
+    assert text_input._text_surface is not surface
+
+
 def test_text_input_activation(screen):
     """Test text input activation on click."""
     text_input = TextInput(100, 100, 200, 40)
     
-    # Mock mouse position inside input
-    pygame.mouse.get_pos = lambda: (150, 120)
-    
     # Click event
     event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(150, 120))
     handled = text_input.handle_event(event)
@@ -252,15 +275,12 @@ def test_component_is_hovered():
     """Test component hover detection."""
     component = UIComponent(100, 100, 100, 100)
     
-    # Mock mouse inside component
-    pygame.mouse.get_pos = lambda: (150, 150)
-    assert component.is_hovered() is True
+    # Mouse inside component
+    assert component.is_hovered(pos=(150, 150)) is True
     
-    # Mock mouse outside component
-    pygame.mouse.get_pos = lambda: (10, 10)
-    assert component.is_hovered() is False
+    # Mouse outside component
+    assert component.is_hovered(pos=(10, 10)) is False
     
     # Disabled component should not be hovered
-    pygame.mouse.get_pos = lambda: (150, 150)
     component.enabled = False
-    assert component.is_hovered() is False
+    assert component.is_hovered(pos=(150, 150)) is False
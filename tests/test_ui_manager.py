@@ -8,9 +8,9 @@ from tycoon_engine.ui.ui_manager import UIManager
 from tycoon_engine.ui.components import UIComponent, Button, Label
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def init_pygame():
-    """Initialize pygame for all tests."""
+    """Initialize pygame once for all tests."""
     pygame.init()
     yield
 
@@ -21,10 +21,10 @@ def ui_manager():
     return UIManager()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def screen():
-    """Create a test screen surface."""
-    return pygame.display.set_mode((800, 600))
+    """Create a test screen surface (an off-screen render target, no window)."""
+    return pygame.Surface((800, 600))
 
 
 def test_ui_manager_creation(ui_manager):
@@ -53,6 +53,20 @@ def test_remove_component(ui_manager):
     assert component not in ui_manager.components
 
 
+def test_remove_component_keeps_order(ui_manager):
+    """Test removing a component keeps the others in render order."""
+    labels = [Label(f"Test{i}", 0, i * 10) for i in range(4)]
+    for label in labels:
+        ui_manager.add_component(label)
+    
+    # Adding a managed component again has no effect
+    ui_manager.add_component(labels[0])
+    ui_manager.remove_component(labels[1])
+    ui_manager.remove_component(labels[1])
+    
+    assert ui_manager.components == [labels[0], labels[2], labels[3]]
+
+
 def test_clear_all(ui_manager):
     """Test clearing all components."""
     ui_manager.add_component(Label("Test1", 0, 0))
@@ -108,9 +122,6 @@ def test_handle_event(ui_manager):
     button = Button("Click", 100, 100, 100, 50, callback=callback)
     ui_manager.add_component(button)
     
-    # Mock mouse position
-    pygame.mouse.get_pos = lambda: (150, 125)
-    
     event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(150, 125))
     handled = ui_manager.handle_event(event)
     
@@ -135,9 +146,6 @@ def test_event_order_top_to_bottom(ui_manager):
     ui_manager.add_component(button1)
     ui_manager.add_component(button2)  # Added last, should be on top
     
-    # Mock mouse position
-    pygame.mouse.get_pos = lambda: (150, 125)
-    
     event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(150, 125))
     ui_manager.handle_event(event)
     
@@ -273,6 +281,8 @@ def test_get_components(ui_manager):
     assert component1 in components
     assert component2 in components
     
-    # Should return a copy
-    components.clear()
-    assert ui_manager.count() == 2
+    # Should return an immutable snapshot
+    assert components == (component1, component2)
+    ui_manager.remove_component(component1)
+    assert len(components) == 2
+    assert list(ui_manager.iter_components()) == [component2]
@@ -3,7 +3,7 @@ Tests for utility functions.
 """
 
 import pytest
-from tycoon_engine.utils.helpers import Timer, clamp, lerp, distance
+from tycoon_engine.utils.helpers import Timer, TimerWheel, clamp, lerp, distance
 
 
 def test_timer_creation():
@@ -117,6 +117,54 @@ def test_timer_stop():
     assert len(callback_called) == 0
 
 
+def test_timer_wheel():
+    """Test timer wheel fires timers like individual Timers."""
+    calls = []
+    wheel = TimerWheel()
+    
+    once_id = wheel.add_timer(0.5, lambda: calls.append('once'), repeat=False)
+    wheel.add_timer(0.3, lambda: calls.append('repeat'))
+    assert wheel.count() == 2
+    
+    wheel.update(0.2)
+    assert calls == []
+    
+    wheel.update(0.3)
+    assert calls == ['repeat', 'once']
+    assert wheel.count() == 1
+    assert wheel.remove_timer(once_id) is False
+    
+    # A long update fires a repeating timer once and keeps the excess time
+    calls.clear()
+    wheel.update(1.0)
+    assert calls == ['repeat']
+    wheel.update(0.0)
+    assert calls == ['repeat', 'repeat']
+
+
+def test_timer_wheel_remove():
+    """Test removing timers from a timer wheel."""
+    calls = []
+    wheel = TimerWheel()
+    
+    timer_id = wheel.add_timer(0.5, lambda: calls.append(1))
+    
+    def remove_self():
+        calls.append(2)
+        wheel.remove_timer(self_id)
+    
+    self_id = wheel.add_timer(0.5, remove_self)
+    
+    assert wheel.remove_timer(timer_id) is True
+    wheel.update(0.5)
+    wheel.update(0.5)
+    assert calls == [2]
+    assert wheel.count() == 0
+    
+    with pytest.raises(ValueError):
+        wheel.add_timer(0.0, lambda: None)
+
+
 def test_clamp():
     """Test clamp function."""
     assert clamp(5, 0, 10) == 5
@@ -51,6 +51,25 @@ def test_node_properties():
     assert node.get_property("nonexistent", "default") == "default"
 
 
+def test_node_properties_allocated_on_first_set():
+    """Test nodes and edges without custom properties stay compact."""
+    node = Node("node_1", 0.0, 0.0)
+    edge = Edge("edge_1", "node_1", "node_2")
+    
+    assert not hasattr(node, '__dict__')
+    assert not hasattr(edge, '__dict__')
+    
+    # Reading doesn't allocate a properties dict
+    assert node.get_property("missing", 7) == 7
+    assert node.to_dict()['properties'] == {}
+    assert Node.from_dict(node.to_dict())._properties is None
+    assert node._properties is None
+    
+    edge.set_property("type", "rail")
+    assert edge.properties == {"type": "rail"}
+    assert Edge.from_dict(edge.to_dict()).get_property("type") == "rail"
+
+
 def test_node_edge_tracking():
     """Test node tracking of connected edges."""
     node = Node("node_1", 0.0, 0.0)
@@ -273,6 +292,25 @@ def test_world_map_get_node():
     assert world_map.get_node("nonexistent") is None
 
 
+def test_world_map_generate_ids():
+    """Test generated node and edge IDs are unique within the map."""
+    world_map = WorldMap()
+    
+    # An existing node already uses the first generated ID
+    world_map.add_node(Node("node_0", 0.0, 0.0))
+    
+    node_id = world_map.generate_node_id()
+    assert node_id == "node_1"
+    world_map.add_node(Node(node_id, 1.0, 0.0))
+    assert world_map.generate_node_id() == "node_2"
+    assert world_map.generate_node_id("city") == "city_3"
+    
+    edge_id = world_map.generate_edge_id()
+    assert edge_id == "edge_0"
+    assert world_map.add_edge(Edge(edge_id, "node_0", "node_1")) is True
+    assert world_map.generate_edge_id() == "edge_1"
+
+
 def test_world_map_add_edge():
     """Test adding edges to world map."""
     world_map = WorldMap()
@@ -384,6 +422,115 @@ def test_world_map_get_neighbors():
     assert node3 in neighbors
 
 
+def test_world_map_nodes_in_radius():
+    """Test finding nodes within a radius of a point."""
+    world_map = WorldMap()
+    
+    node1 = Node("n1", 0.0, 0.0)
+    node2 = Node("n2", 3.0, 4.0)
+    node3 = Node("n3", 10.0, 10.0)
+    world_map.add_node(node1)
+    world_map.add_node(node2)
+    world_map.add_node(node3)
+    
+    # Radius is inclusive
+    nodes = world_map.get_nodes_in_radius(0.0, 0.0, 5.0)
+    assert len(nodes) == 2
+    assert node1 in nodes
+    assert node2 in nodes
+    
+    assert world_map.get_nodes_in_radius(10.0, 10.0, 1.0) == [node3]
+    assert world_map.get_nodes_in_radius(100.0, 100.0, 1.0) == []
+
+
+def test_world_map_find_path():
+    """Test finding the path with the fewest edges."""
+    world_map = WorldMap()
+    
+    for i in range(5):
+        world_map.add_node(Node(f"n{i}", float(i), 0.0))
+    
+    # Chain n0-n1-n2-n3 plus a shortcut n0-n4-n3
+    world_map.add_edge(Edge("e1", "n0", "n1"))
+    world_map.add_edge(Edge("e2", "n1", "n2"))
+    world_map.add_edge(Edge("e3", "n2", "n3"))
+    world_map.add_edge(Edge("e4", "n0", "n4"))
+    world_map.add_edge(Edge("e5", "n4", "n3"))
+    
+    assert world_map.find_path("n0", "n3") == ["n0", "n4", "n3"]
+    assert world_map.find_path("n3", "n0") == ["n3", "n4", "n0"]
+    assert world_map.find_path("n2", "n2") == ["n2"]
+    assert world_map.find_path("n0", "missing") is None
+    
+    # Cached paths are invalidated when the map changes
+    path = world_map.find_path("n0", "n3")
+    path.append("modified")
+    world_map.remove_edge("e5")
+    assert world_map.find_path("n0", "n3") == ["n0", "n1", "n2", "n3"]
+
+
+def test_world_map_find_path_one_way():
+    """Test one-way edges are only followed from their from-node."""
+    world_map = WorldMap()
+    
+    world_map.add_node(Node("a", 0.0, 0.0))
+    world_map.add_node(Node("b", 1.0, 0.0))
+    world_map.add_node(Node("c", 2.0, 0.0))
+    world_map.add_edge(Edge("e1", "a", "b", bidirectional=False))
+    
+    assert world_map.find_path("a", "b") == ["a", "b"]
+    assert world_map.find_path("b", "a") is None
+    assert world_map.find_path("a", "c") is None
+    
+    # One-way ring a -> b -> c -> d -> a: the path must follow the ring
+    world_map.add_node(Node("d", 3.0, 0.0))
+    world_map.add_edge(Edge("e2", "b", "c", bidirectional=False))
+    world_map.add_edge(Edge("e3", "c", "d", bidirectional=False))
+    world_map.add_edge(Edge("e4", "d", "a", bidirectional=False))
+    assert world_map.find_path("a", "d") == ["a", "b", "c", "d"]
+    assert world_map.find_path("d", "c") == ["d", "a", "b", "c"]
+
+
+def test_world_map_find_path_cache_invalidation():
+    """Test cached paths are dropped when the graph changes outside add/remove."""
+    world_map = WorldMap()
+    for node_id in ("a", "b", "c"):
+        world_map.add_node(Node(node_id, 0.0, 0.0))
+    edge = Edge("e1", "a", "b", bidirectional=False)
+    world_map.add_edge(edge)
+    
+    assert world_map.find_path("b", "a") is None
+    edge.bidirectional = True
+    assert world_map.find_path("b", "a") == ["b", "a"]
+    
+    edge.to_node_id = "c"
+    world_map.get_node("c").add_edge("e1")
+    assert world_map.find_path("a", "c") == ["a", "c"]
+    
+    # Direct changes to the nodes and edges dicts
+    del world_map.edges["e1"]
+    assert world_map.find_path("a", "c") is None
+    world_map.edges["e1"] = edge
+    assert world_map.find_path("a", "c") == ["a", "c"]
+    world_map.nodes.pop("c")
+    assert world_map.find_path("a", "c") is None
+    
+    # Edges no longer in the map don't touch its cache
+    world_map.edges.clear()
+    assert world_map.find_path("a", "b") is None
+    edge.bidirectional = False
+    assert world_map.find_path("a", "b") is None
+    
+    # Other changes can invalidate the cache explicitly
+    world_map.add_edge(Edge("e2", "a", "b"))
+    assert world_map.find_path("a", "b") == ["a", "b"]
+    world_map.get_node("b")._connected_edges.clear()
+    world_map.get_node("a")._connected_edges.clear()
+    assert world_map.find_path("a", "b") == ["a", "b"]
+    world_map.invalidate_path_cache()
+    assert world_map.find_path("a", "b") is None
+
+
 def test_world_map_get_all():
     """Test getting all nodes and edges."""
     world_map = WorldMap()
@@ -15,6 +15,12 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class GameConfig:
@@ -50,16 +56,36 @@ class GameConfig:
     
     @classmethod
     def from_json(cls, json_path: str) -> "GameConfig":
-        """Load configuration from a JSON file."""
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        """
+        Load configuration from a JSON file.
+        
+        Uses orjson when it is installed, falling back to the json module.
+        """
+        if ORJSON_AVAILABLE:
+            with open(json_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(json_path, 'r') as f:
+                data = json.load(f)
         return cls(**data)
     
     def to_json(self, json_path: str) -> None:
-        """Save configuration to a JSON file."""
+        """
+        Save configuration to a JSON file.
+        
+        Uses orjson when it is installed, falling back to the json module.
+        """
         from dataclasses import asdict
-        with open(json_path, 'w') as f:
-            json.dump(asdict(self), f, indent=2)
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(
+                asdict(self),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+            with open(json_path, 'wb') as f:
+                f.write(content)
+        else:
+            with open(json_path, 'w') as f:
+                json.dump(asdict(self), f, indent=2)
     
     @classmethod
     def from_yaml(cls, yaml_path: str) -> "GameConfig":
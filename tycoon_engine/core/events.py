@@ -4,9 +4,11 @@ Event dispatcher module.
 Provides a flexible event system for handling keyboard, mouse, and custom game events.
 """
 
+import bisect
+import heapq
 import pygame
-from typing import Callable, Dict, List, Any, Optional
-from collections import defaultdict
+from typing import Callable, Deque, Dict, List, Any, Optional
+from collections import defaultdict, deque
 from enum import IntEnum
 
 
@@ -25,6 +27,8 @@ class GameEvent:
     Used for game-specific events beyond standard pygame events.
     """
     
+    __slots__ = ('event_type', 'data', 'timestamp')
+    
     def __init__(self, event_type: str, data: Optional[Dict[str, Any]] = None):
         """
         Initialize a game event.
@@ -41,6 +45,40 @@ class GameEvent:
         return f"GameEvent(type={self.event_type}, data={self.data}, timestamp={self.timestamp})"
 
 
+# Event attribute used to route each filterable pygame event type to the
+# listeners registered for one specific value (see subscribe_key)
+_FILTER_ATTRIBUTES: Dict[int, str] = {
+    pygame.KEYDOWN: 'key',
+    pygame.MOUSEBUTTONDOWN: 'button',
+}
+
+
+def _remove_callback(
+    listeners_by_key: Dict[Any, List["EventListener"]],
+    key: Any,
+    callback: Callable,
+) -> None:
+    """
+    Remove every listener for a callback, dropping the entry once it is empty.
+    
+    The remaining listeners are stored as a new list, so a dispatch that is
+    iterating the old list is not affected.
+    
+    Args:
+        listeners_by_key: Map of event type (or key/button) to listeners
+        key: Entry to remove the callback from
+        callback: The callback function to remove
+    """
+    listeners = listeners_by_key.get(key)
+    if listeners is None:
+        return
+    remaining = [l for l in listeners if l.callback != callback]
+    if remaining:
+        listeners_by_key[key] = remaining
+    else:
+        del listeners_by_key[key]
+
+
 class EventListener:
     """Represents a listener for events with callback and priority."""
     
@@ -58,6 +96,10 @@ class EventListener:
     def __call__(self, event: Any) -> None:
         """Execute the callback with the event."""
         self.callback(event)
+    
+    def __lt__(self, other: "EventListener") -> bool:
+        """Order listeners so that higher priorities come first."""
+        return self.priority > other.priority
 
 
 class EventDispatcher:
@@ -77,8 +119,12 @@ class EventDispatcher:
         self._pygame_listeners: Dict[int, List[EventListener]] = defaultdict(list)
         self._custom_listeners: Dict[str, List[EventListener]] = defaultdict(list)
         
-        # Event queue for custom events
-        self._event_queue: List[GameEvent] = []
+        # Maps event type to {key/button value: listeners} for listeners that
+        # only care about one key or mouse button
+        self._filtered_listeners: Dict[int, Dict[int, List[EventListener]]] = {}
+        
+        # Event queue for custom events (FIFO)
+        self._event_queue: Deque[GameEvent] = deque()
     
     def subscribe(
         self, 
@@ -97,39 +143,86 @@ class EventDispatcher:
         """
         listener = EventListener(callback, priority)
         
+        # Listener lists are kept sorted by priority (highest first); insort
+        # places a new listener after existing ones of the same priority
         if isinstance(event_type, int):
             # Pygame event
-            self._pygame_listeners[event_type].append(listener)
-            # Sort by priority (highest first)
-            self._pygame_listeners[event_type].sort(key=lambda x: x.priority, reverse=True)
+            bisect.insort(self._pygame_listeners[event_type], listener)
         elif isinstance(event_type, str):
             # Custom event
-            self._custom_listeners[event_type].append(listener)
-            # Sort by priority (highest first)
-            self._custom_listeners[event_type].sort(key=lambda x: x.priority, reverse=True)
+            bisect.insort(self._custom_listeners[event_type], listener)
         else:
             raise TypeError(f"Invalid event_type: {event_type}. Must be int or str.")
     
+    def subscribe_key(
+        self,
+        key: int,
+        callback: Callable,
+        priority: EventPriority = EventPriority.NORMAL
+    ) -> None:
+        """
+        Subscribe to KEYDOWN events for a single key.
+        
+        Unlike a KEYDOWN listener that checks event.key itself, the callback
+        is only looked up and called when that key is pressed.
+        
+        Args:
+            key: Pygame key constant (e.g., pygame.K_SPACE)
+            callback: Function to call when the key is pressed
+            priority: Priority level for this listener
+        """
+        self._subscribe_filtered(pygame.KEYDOWN, key, callback, priority)
+    
+    def subscribe_mouse_button(
+        self,
+        button: int,
+        callback: Callable,
+        priority: EventPriority = EventPriority.NORMAL
+    ) -> None:
+        """
+        Subscribe to MOUSEBUTTONDOWN events for a single mouse button.
+        
+        Args:
+            button: Mouse button number (1=left, 2=middle, 3=right)
+            callback: Function to call when the button is clicked
+            priority: Priority level for this listener
+        """
+        self._subscribe_filtered(pygame.MOUSEBUTTONDOWN, button, callback, priority)
+    
+    def _subscribe_filtered(
+        self,
+        event_type: int,
+        value: int,
+        callback: Callable,
+        priority: EventPriority
+    ) -> None:
+        """Register a listener for one key/button value of a pygame event type."""
+        by_value = self._filtered_listeners.setdefault(event_type, {})
+        bisect.insort(by_value.setdefault(value, []), EventListener(callback, priority))
+    
     def unsubscribe(self, event_type: Any, callback: Callable) -> None:
         """
         Unsubscribe from an event.
         
+        Listeners registered with subscribe_key or subscribe_mouse_button are
+        removed by unsubscribing from KEYDOWN or MOUSEBUTTONDOWN respectively.
+        
         Args:
             event_type: Event type to unsubscribe from
             callback: The callback function to remove
         """
         if isinstance(event_type, int):
             # Pygame event
-            listeners = self._pygame_listeners[event_type]
-            self._pygame_listeners[event_type] = [
-                l for l in listeners if l.callback != callback
-            ]
+            _remove_callback(self._pygame_listeners, event_type, callback)
+            by_value = self._filtered_listeners.get(event_type)
+            if by_value:
+                for value in list(by_value):
+                    _remove_callback(by_value, value, callback)
+                if not by_value:
+                    del self._filtered_listeners[event_type]
         elif isinstance(event_type, str):
             # Custom event
-            listeners = self._custom_listeners[event_type]
-            self._custom_listeners[event_type] = [
-                l for l in listeners if l.callback != callback
-            ]
+            _remove_callback(self._custom_listeners, event_type, callback)
     
     def dispatch_pygame_event(self, event: pygame.event.Event) -> None:
         """
@@ -138,9 +231,21 @@ class EventDispatcher:
         Args:
             event: Pygame event to dispatch
         """
-        listeners = self._pygame_listeners.get(event.type, [])
-        for listener in listeners:
-            listener(event)
+        # Most pygame events (mouse motion, window events...) have no
+        # listeners; skip them without building an empty list
+        listeners = self._pygame_listeners.get(event.type)
+        
+        by_value = self._filtered_listeners.get(event.type)
+        if by_value:
+            matching = by_value.get(getattr(event, _FILTER_ATTRIBUTES[event.type], None))
+            if matching:
+                # Interleave with the general listeners by priority; on a tie
+                # the general listeners run first
+                listeners = list(heapq.merge(listeners, matching)) if listeners else matching
+        
+        if listeners:
+            for listener in listeners:
+                listener(event)
     
     def dispatch_custom_event(self, event_type: str, data: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -155,8 +260,9 @@ class EventDispatcher:
     
     def process_custom_events(self) -> None:
         """Process all custom events in the queue."""
-        while self._event_queue:
-            event = self._event_queue.pop(0)
+        queue = self._event_queue
+        while queue:
+            event = queue.popleft()
             listeners = self._custom_listeners.get(event.event_type, [])
             for listener in listeners:
                 listener(event)
@@ -165,6 +271,7 @@ class EventDispatcher:
         """Clear all event listeners and queued events."""
         self._pygame_listeners.clear()
         self._custom_listeners.clear()
+        self._filtered_listeners.clear()
         self._event_queue.clear()
     
     def clear_event_type(self, event_type: Any) -> None:
@@ -176,6 +283,7 @@ class EventDispatcher:
         """
         if isinstance(event_type, int):
             self._pygame_listeners.pop(event_type, None)
+            self._filtered_listeners.pop(event_type, None)
         elif isinstance(event_type, str):
             self._custom_listeners.pop(event_type, None)
     
@@ -189,10 +297,11 @@ class EventDispatcher:
         Returns:
             True if there are listeners, False otherwise
         """
+        # Listener maps never keep empty entries, so membership is enough
         if isinstance(event_type, int):
-            return len(self._pygame_listeners.get(event_type, [])) > 0
+            return event_type in self._pygame_listeners or event_type in self._filtered_listeners
         elif isinstance(event_type, str):
-            return len(self._custom_listeners.get(event_type, [])) > 0
+            return event_type in self._custom_listeners
         return False
 
 
@@ -203,6 +312,9 @@ def on_key_down(dispatcher: EventDispatcher, key: int, callback: Callable,
     """
     Subscribe to a specific key press event.
     
+    The listener is registered with dispatcher.subscribe_key(), so it is only
+    invoked for the given key.
+    
     Note: This creates a closure filter. To unsubscribe, you must use the returned
     filter function with dispatcher.unsubscribe(), not the original callback.
     
@@ -219,7 +331,7 @@ def on_key_down(dispatcher: EventDispatcher, key: int, callback: Callable,
         if event.key == key:
             callback(event)
     
-    dispatcher.subscribe(pygame.KEYDOWN, key_filter, priority)
+    dispatcher.subscribe_key(key, key_filter, priority)
     return key_filter
 
 
@@ -228,6 +340,9 @@ def on_mouse_click(dispatcher: EventDispatcher, button: int, callback: Callable,
     """
     Subscribe to a specific mouse button click event.
     
+    The listener is registered with dispatcher.subscribe_mouse_button(), so it
+    is only invoked for the given button.
+    
     Note: This creates a closure filter. To unsubscribe, you must use the returned
     filter function with dispatcher.unsubscribe(), not the original callback.
     
@@ -244,5 +359,5 @@ def on_mouse_click(dispatcher: EventDispatcher, button: int, callback: Callable,
         if event.button == button:
             callback(event)
     
-    dispatcher.subscribe(pygame.MOUSEBUTTONDOWN, button_filter, priority)
+    dispatcher.subscribe_mouse_button(button, button_filter, priority)
     return button_filter
@@ -76,6 +76,11 @@ class Game:
                 else:
                     self.state_manager.handle_event(event)
             
+            # States can stop the game directly without posting a QUIT event
+            if self.state_manager.quit_requested:
+                self.running = False
+                break
+            
             # Update game state
             self.state_manager.update(dt)
             
@@ -60,6 +60,7 @@ class StateManager:
         self.current_state: Optional[GameState] = None
         self.current_state_name: Optional[str] = None
         self.state_data: Dict[str, Any] = {}  # Persistent data across states
+        self.quit_requested = False
     
     def add_state(self, name: str, state: GameState) -> None:
         """Register a new state."""
@@ -85,6 +86,10 @@ class StateManager:
         self.current_state_name = name
         self.current_state.enter(**kwargs)
     
+    def request_quit(self) -> None:
+        """Ask the game loop to stop after the current batch of events."""
+        self.quit_requested = True
+    
     def update(self, dt: float) -> None:
         """Update the current state."""
         if self.current_state:
@@ -15,6 +15,10 @@ class Entity:
     Entities represent game objects like buildings, resources, workers, etc.
     """
     
+    # Subclasses that don't declare __slots__ still get a __dict__ for
+    # their own attributes
+    __slots__ = ('id', '_type', 'x', 'y', 'active', 'properties', '_manager')
+    
     def __init__(self, entity_id: str, entity_type: str, x: float, y: float):
         """
         Initialize an entity.
@@ -26,11 +30,27 @@ class Entity:
             y: Y position in game world
         """
         self.id = entity_id
-        self.type = entity_type
+        self._type = entity_type
         self.x = x
         self.y = y
         self.active = True
         self.properties: Dict[str, Any] = {}
+        
+        # EntityManager holding this entity, told about type changes
+        self._manager: Optional["EntityManager"] = None
+    
+    @property
+    def type(self) -> str:
+        """Type classification of this entity."""
+        return self._type
+    
+    @type.setter
+    def type(self, value: str) -> None:
+        """Set the type, moving the entity to its new type in its EntityManager."""
+        old_type = self._type
+        self._type = value
+        if self._manager is not None and value != old_type:
+            self._manager._retype(self, old_type)
     
     def update(self, dt: float) -> None:
         """
@@ -110,6 +130,10 @@ class EntityManager:
         self.entities: Dict[str, Entity] = {}
         self.max_entities = max_entities
         self._next_id = 0
+        
+        # Entities grouped by type (type -> id -> entity), in insertion order.
+        # Setting Entity.type moves the entity to the end of its new bucket.
+        self._entities_by_type: Dict[str, Dict[str, Entity]] = {}
     
     def add_entity(self, entity: Entity) -> bool:
         """
@@ -121,9 +145,38 @@ class EntityManager:
         if len(self.entities) >= self.max_entities:
             return False
         
+        replaced = self.entities.get(entity.id)
+        if replaced is not None:
+            self._remove_from_type_index(replaced, replaced.type)
+            replaced._manager = None
+        
         self.entities[entity.id] = entity
+        entity._manager = self
+        self._add_to_type_index(entity)
         return True
     
+    def _add_to_type_index(self, entity: Entity) -> None:
+        """File an entity in the bucket for its current type."""
+        bucket = self._entities_by_type.get(entity.type)
+        if bucket is None:
+            bucket = self._entities_by_type[entity.type] = {}
+        bucket[entity.id] = entity
+    
+    def _remove_from_type_index(self, entity: Entity, entity_type: str) -> None:
+        """Drop an entity from a type bucket, discarding empty buckets."""
+        bucket = self._entities_by_type.get(entity_type)
+        if bucket is not None:
+            bucket.pop(entity.id, None)
+            if not bucket:
+                del self._entities_by_type[entity_type]
+    
+    def _retype(self, entity: Entity, old_type: str) -> None:
+        """Move an entity whose type was changed from old_type."""
+        if self.entities.get(entity.id) is not entity:
+            return
+        self._remove_from_type_index(entity, old_type)
+        self._add_to_type_index(entity)
+    
     def remove_entity(self, entity_id: str) -> bool:
         """
         Remove an entity by ID.
@@ -131,10 +184,12 @@ class EntityManager:
         Returns:
             True if removed, False if not found
         """
-        if entity_id in self.entities:
-            del self.entities[entity_id]
-            return True
-        return False
+        entity = self.entities.pop(entity_id, None)
+        if entity is None:
+            return False
+        self._remove_from_type_index(entity, entity.type)
+        entity._manager = None
+        return True
     
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Get an entity by ID."""
@@ -142,7 +197,8 @@ class EntityManager:
     
     def get_entities_by_type(self, entity_type: str) -> list:
         """Get all entities of a specific type."""
-        return [e for e in self.entities.values() if e.type == entity_type]
+        bucket = self._entities_by_type.get(entity_type)
+        return list(bucket.values()) if bucket else []
     
     def get_all_entities(self) -> list:
         """Get all entities."""
@@ -162,7 +218,10 @@ class EntityManager:
     
     def clear(self) -> None:
         """Remove all entities."""
+        for entity in self.entities.values():
+            entity._manager = None
         self.entities.clear()
+        self._entities_by_type.clear()
     
     def generate_id(self, prefix: str = "entity") -> str:
         """Generate a unique entity ID."""
@@ -4,14 +4,37 @@ Resource management system for tycoon games.
 Handles money, resources, and other game economy elements.
 """
 
+import math
 from typing import Dict, Optional
 
 
+# Money is stored as an integer number of millionths so that balances stay
+# exact under repeated small transactions
+_MONEY_SCALE = 1000000
+
+
+def _to_money_units(amount: float) -> int:
+    """
+    Convert an amount of money to integer storage units.
+    
+    Raises:
+        ValueError: If the amount is infinite or NaN
+    """
+    if not math.isfinite(amount):
+        raise ValueError(f"Money amount must be finite, got {amount}")
+    return round(amount * _MONEY_SCALE)
+
+
 class ResourceManager:
     """
     Manages game resources like money, materials, etc.
     
     Provides a flexible system for tracking and managing different resource types.
+    
+    Money is kept in fixed point (millionths), so adding and removing amounts
+    does not accumulate floating point error; it is read and written as a
+    float through the money property. Amounts must be finite; infinite or
+    NaN amounts raise ValueError.
     """
     
     def __init__(self, starting_money: float = 10000.0):
@@ -21,12 +44,22 @@ class ResourceManager:
         Args:
             starting_money: Initial amount of money
         """
-        self.money = starting_money
+        self._money_units = _to_money_units(starting_money)
         self.resources: Dict[str, float] = {}
     
+    @property
+    def money(self) -> float:
+        """Current money balance."""
+        return self._money_units / _MONEY_SCALE
+    
+    @money.setter
+    def money(self, amount: float) -> None:
+        """Set the money balance (unlike set_money, not clamped at zero)."""
+        self._money_units = _to_money_units(amount)
+    
     def add_money(self, amount: float) -> None:
         """Add money to the player's balance."""
-        self.money += amount
+        self._money_units += _to_money_units(amount)
     
     def remove_money(self, amount: float) -> bool:
         """
@@ -35,28 +68,28 @@ class ResourceManager:
         Returns:
             True if successful, False if insufficient funds
         """
-        if self.money >= amount:
-            self.money -= amount
+        units = _to_money_units(amount)
+        if self._money_units >= units:
+            self._money_units -= units
             return True
         return False
     
     def get_money(self) -> float:
         """Get current money balance."""
-        return self.money
+        return self._money_units / _MONEY_SCALE
     
     def set_money(self, amount: float) -> None:
         """Set money to a specific amount."""
-        self.money = max(0, amount)
+        self._money_units = max(0, _to_money_units(amount))
     
     def can_afford(self, amount: float) -> bool:
         """Check if player can afford a certain amount."""
-        return self.money >= amount
+        return self._money_units >= _to_money_units(amount)
     
     def add_resource(self, resource_type: str, amount: float) -> None:
         """Add a resource."""
-        if resource_type not in self.resources:
-            self.resources[resource_type] = 0
-        self.resources[resource_type] += amount
+        resources = self.resources
+        resources[resource_type] = resources.get(resource_type, 0) + amount
     
     def remove_resource(self, resource_type: str, amount: float) -> bool:
         """
@@ -65,11 +98,13 @@ class ResourceManager:
         Returns:
             True if successful, False if insufficient resources
         """
-        if resource_type not in self.resources:
+        resources = self.resources
+        current = resources.get(resource_type)
+        if current is None:
             return False
         
-        if self.resources[resource_type] >= amount:
-            self.resources[resource_type] -= amount
+        if current >= amount:
+            resources[resource_type] = current - amount
             return True
         return False
     
@@ -83,7 +118,7 @@ class ResourceManager:
     
     def has_resource(self, resource_type: str, amount: float) -> bool:
         """Check if player has enough of a resource."""
-        return self.get_resource(resource_type) >= amount
+        return self.resources.get(resource_type, 0) >= amount
     
     def get_all_resources(self) -> Dict[str, float]:
         """Get all resources as a dictionary."""
@@ -5,7 +5,7 @@ Handles connection to game server and state synchronization.
 """
 
 import socketio
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, List, Optional
 import threading
 
 
@@ -16,27 +16,33 @@ class GameClient:
     Connects to game server and handles state synchronization.
     """
     
-    def __init__(self, host: str = "localhost", port: int = 5000):
+    def __init__(self, host: str = "localhost", port: int = 5000, serializer: str = 'default'):
         """
         Initialize game client.
         
         Args:
             host: Server host address
             port: Server port
+            serializer: Socket.IO packet serializer, 'default' (JSON) or
+                'msgpack' (requires the msgpack package). Must match the server.
         """
         self.host = host
         self.port = port
         self.url = f"http://{host}:{port}"
-        self.sio = socketio.Client()
+        self.sio = socketio.Client(serializer=serializer)
         self.connected = False
         self.player_id: Optional[str] = None
         self.player_name: Optional[str] = None
         
+        # Latest game state: the last full snapshot with deltas merged in
+        self.game_state: Dict[str, Any] = {}
+        
         # Callbacks for events
         self.on_state_update: Optional[Callable[[Dict[str, Any]], None]] = None
         self.on_chat_message: Optional[Callable[[Dict[str, Any]], None]] = None
         self.on_player_joined: Optional[Callable[[Dict[str, Any]], None]] = None
         self.on_player_left: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.on_action_error: Optional[Callable[[Dict[str, Any]], None]] = None
         
         self._setup_handlers()
     
@@ -57,10 +63,20 @@ class GameClient:
         
         @self.sio.event
         def game_state(data):
-            """Handle game state updates from server."""
+            """Handle full game state updates from server."""
+            self.game_state = data
             if self.on_state_update:
                 self.on_state_update(data)
         
+        @self.sio.event
+        def state_delta(data):
+            """Handle partial game state updates from server."""
+            # Build a new dict rather than updating in place, so states
+            # already handed to callbacks don't change underneath them
+            self.game_state = {**self.game_state, **data['changes']}
+            if self.on_state_update:
+                self.on_state_update(self.game_state)
+        
         @self.sio.event
         def chat_message(data):
             """Handle chat messages."""
@@ -78,6 +94,14 @@ class GameClient:
             """Handle player left event."""
             if self.on_player_left:
                 self.on_player_left(data)
+        
+        @self.sio.event
+        def action_error(data):
+            """Handle an action the server rejected."""
+            if self.on_action_error:
+                self.on_action_error(data)
+            else:
+                print(f"Action rejected by server: {data.get('message')}")
     
     def connect(self, player_name: Optional[str] = None) -> bool:
         """
@@ -134,6 +158,18 @@ class GameClient:
         if self.connected:
             self.sio.emit('player_action', action)
     
+    def send_actions_batch(self, actions: List[Dict[str, Any]]) -> None:
+        """
+        Send several player actions to the server in a single message.
+        
+        The server applies them in order and broadcasts the game state once.
+        
+        Args:
+            actions: List of action data dictionaries
+        """
+        if self.connected and actions:
+            self.sio.emit('player_action', {'type': 'batch', 'actions': list(actions)})
+    
     def send_chat(self, message: str) -> None:
         """
         Send a chat message.
@@ -6,11 +6,36 @@ Handles client connections and game state synchronization.
 
 import socketio
 import eventlet
+import queue
+import socket
+import threading
 import time
+from eventlet.greenio import GreenSocket
 from typing import Dict, Any, Optional
 import json
 
 
+# Maximum number of actions accepted in one batch action; larger batches
+# are rejected so a single message can't make the server do unbounded work
+MAX_BATCH_ACTIONS = 100
+
+
+def _snapshot(data: Any) -> Any:
+    """
+    Copy an emit payload two levels deep.
+    
+    Game state values (entities, players...) are dicts whose entries are
+    added, removed or replaced, so copying them as well as the top level is
+    enough to serialize the payload safely on another thread.
+    """
+    if isinstance(data, dict):
+        return {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in data.items()
+        }
+    return data
+
+
 class GameServer:
     """
     Multiplayer game server using Socket.IO.
@@ -22,7 +47,14 @@ class GameServer:
     trusted origins by passing a specific list or domain pattern.
     """
     
-    def __init__(self, host: str = "localhost", port: int = 5000, cors_origins: str = '*'):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 5000,
+        cors_origins: str = '*',
+        full_state_interval: int = 100,
+        serializer: str = 'default'
+    ):
         """
         Initialize game server.
         
@@ -30,10 +62,15 @@ class GameServer:
             host: Server host address
             port: Server port
             cors_origins: CORS allowed origins ('*' for all, or specific origins)
+            full_state_interval: update_state() sends only the changed keys;
+                every this many deltas the full game state is sent instead
+            serializer: Socket.IO packet serializer, 'default' (JSON) or
+                'msgpack' (smaller and faster; requires the msgpack package).
+                Clients must use the same serializer.
         """
         self.host = host
         self.port = port
-        self.sio = socketio.Server(cors_allowed_origins=cors_origins)
+        self.sio = socketio.Server(cors_allowed_origins=cors_origins, serializer=serializer)
         self.app = socketio.WSGIApp(self.sio)
         
         # Game state
@@ -47,6 +84,19 @@ class GameServer:
         }
         self.ai_counter = 0
         
+        # Deltas sent since the last full game_state broadcast
+        self.full_state_interval = full_state_interval
+        self._deltas_since_full = 0
+        
+        # Set once the listening socket is bound and clients can connect
+        self.ready = threading.Event()
+        
+        # Emits requested from threads other than the server thread are
+        # queued and handed to the server's event loop (see _emit)
+        self._server_thread_id: Optional[int] = None
+        self._pending_emits: "queue.Queue" = queue.Queue()
+        self._wakeup_socket: Optional[socket.socket] = None
+        
         self._setup_handlers()
     
     def _setup_handlers(self) -> None:
@@ -190,6 +240,29 @@ class GameServer:
         """
         action_type = action.get('type')
         
+        if action_type == 'batch':
+            actions = action.get('actions')
+            if not isinstance(actions, list):
+                print(f"Invalid batch action from {player_id}: actions must be a list")
+                return
+            if len(actions) > MAX_BATCH_ACTIONS:
+                print(f"Rejected batch of {len(actions)} actions from {player_id}")
+                self._emit('action_error', {
+                    'type': 'batch',
+                    'message': f"Batches are limited to {MAX_BATCH_ACTIONS} actions"
+                }, room=player_id)
+                return
+            
+            # Apply each action in order; nested batches are not allowed
+            for sub_action in actions:
+                if isinstance(sub_action, dict) and sub_action.get('type') != 'batch':
+                    self._process_action(player_id, sub_action)
+                else:
+                    print(f"Invalid action in batch from {player_id}")
+            return
+        
+        entities = self.game_state['entities']
+        
         if action_type == 'update_entity':
             entity_id = action.get('entity_id')
             entity_data = action.get('data')
@@ -203,7 +276,7 @@ class GameServer:
             entity_id = entity_id[:100]
             
             if entity_data and isinstance(entity_data, dict):
-                self.game_state['entities'][entity_id] = entity_data
+                entities[entity_id] = entity_data
         
         elif action_type == 'remove_entity':
             entity_id = action.get('entity_id')
@@ -213,20 +286,86 @@ class GameServer:
                 print(f"Invalid entity_id in remove action from {player_id}")
                 return
             
-            if entity_id in self.game_state['entities']:
-                del self.game_state['entities'][entity_id]
+            entities.pop(entity_id, None)
         
         # Increment tick counter
         self.game_state['tick'] += 1
     
+    def _emit(self, event: str, data: Any, room: Optional[str] = None) -> None:
+        """
+        Emit an event from any thread.
+        
+        The eventlet hub only runs on the server thread, so emits from other
+        threads (e.g. a game loop calling update_state) are queued and the
+        server thread is woken up to send them.
+        
+        Args:
+            event: Event name
+            data: Event payload
+            room: Optional room (client sid) to send to
+        """
+        wakeup_socket = self._wakeup_socket
+        if wakeup_socket is None or threading.get_ident() == self._server_thread_id:
+            self.sio.emit(event, data, room=room)
+        else:
+            # The payload is serialized later on the server thread, while
+            # this thread may keep changing the game state; queue a copy
+            self._pending_emits.put((event, _snapshot(data), room))
+            try:
+                wakeup_socket.send(b'\0')
+            except OSError as e:
+                print(f"Failed to wake up server for '{event}' emit: {e}")
+    
+    def _send_pending_emits(self, wakeup: GreenSocket) -> None:
+        """Server-thread task that sends emits queued by other threads."""
+        while wakeup.recv(4096):
+            while True:
+                try:
+                    event, data, room = self._pending_emits.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    self.sio.emit(event, data, room=room)
+                except Exception as e:
+                    # Keep the task alive so later emits are still sent
+                    print(f"Failed to emit '{event}': {e}")
+    
     def broadcast_state(self) -> None:
         """Broadcast current game state to all connected clients."""
-        self.sio.emit('game_state', self.game_state)
+        self._deltas_since_full = 0
+        self._emit('game_state', self.game_state)
     
     def update_state(self, state: Dict[str, Any]) -> None:
-        """Update server game state."""
-        self.game_state.update(state)
-        self.broadcast_state()
+        """
+        Update server game state and broadcast the change.
+        
+        Only the top-level keys whose values changed are sent, as a
+        state_delta event. A dict or list passed as the same object that is
+        already in the game state is assumed to have been modified in place
+        and is always sent. Every full_state_interval deltas the full game state is
+        broadcast instead, so clients resynchronize periodically.
+        
+        Args:
+            state: Top-level game state keys to set
+        """
+        game_state = self.game_state
+        missing = object()
+        changes = {}
+        for key, value in state.items():
+            current = game_state.get(key, missing)
+            if current != value or (current is value and isinstance(value, (dict, list))):
+                changes[key] = value
+        
+        if not changes:
+            return
+        
+        game_state.update(changes)
+        
+        if self._deltas_since_full + 1 >= self.full_state_interval:
+            self.broadcast_state()
+        else:
+            self._deltas_since_full += 1
+            self._emit('state_delta', {'changes': changes})
     
     def spawn_ai_player(self, ai_name: Optional[str] = None) -> str:
         """
@@ -262,7 +401,7 @@ class GameServer:
         }
         
         # Broadcast AI player join
-        self.sio.emit('player_joined', {
+        self._emit('player_joined', {
             'player_id': ai_id,
             'player_name': ai_name,
             'is_ai': True
@@ -297,7 +436,7 @@ class GameServer:
             del self.game_state['players'][ai_id]
         
         # Broadcast AI player leave
-        self.sio.emit('player_left', {
+        self._emit('player_left', {
             'player_id': ai_id,
             'player_name': ai_name,
             'is_ai': True
@@ -311,7 +450,22 @@ class GameServer:
     def run(self) -> None:
         """Start the server."""
         print(f"Starting game server on {self.host}:{self.port}")
-        eventlet.wsgi.server(eventlet.listen((self.host, self.port)), self.app)
+        listener = eventlet.listen((self.host, self.port))
+        
+        wakeup_receiver, wakeup_sender = socket.socketpair()
+        self._wakeup_socket = wakeup_sender
+        self._server_thread_id = threading.get_ident()
+        self.sio.start_background_task(self._send_pending_emits, GreenSocket(wakeup_receiver))
+        
+        self.ready.set()
+        try:
+            eventlet.wsgi.server(listener, self.app)
+        finally:
+            # Later emits go straight to socket.io again
+            self._wakeup_socket = None
+            self._server_thread_id = None
+            wakeup_sender.close()
+            wakeup_receiver.close()
 
 
 def main():
@@ -326,10 +480,21 @@ def main():
         default='*', 
         help='CORS allowed origins (default: * for development, use specific origins in production)'
     )
+    parser.add_argument(
+        '--serializer',
+        choices=['default', 'msgpack'],
+        default='default',
+        help='Message serializer (msgpack requires the msgpack package; clients must match)'
+    )
     
     args = parser.parse_args()
     
-    server = GameServer(host=args.host, port=args.port, cors_origins=args.cors_origins)
+    server = GameServer(
+        host=args.host,
+        port=args.port,
+        cors_origins=args.cors_origins,
+        serializer=args.serializer
+    )
     server.run()
 
 
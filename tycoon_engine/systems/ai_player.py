@@ -4,11 +4,28 @@ AI player system for tycoon games.
 Provides a simple decision loop with hooks for future expansion.
 """
 
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Tuple
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+import heapq
+import itertools
+import sys
 from ..entities.resources import ResourceManager
 
 
+# Seconds between decisions for each difficulty level
+_DIFFICULTY_INTERVALS: Dict[str, float] = {
+    sys.intern("easy"): 5.0,
+    sys.intern("medium"): 3.0,
+    sys.intern("hard"): 1.5,
+}
+_DEFAULT_DECISION_INTERVAL = 3.0
+
+# Truthy when an AI player has queued actions
+_has_queued_actions = attrgetter('_action_queue')
+
+
 class AIPlayerState(Enum):
     """States for AI player behavior."""
     IDLE = "idle"
@@ -17,6 +34,10 @@ class AIPlayerState(Enum):
     WAITING = "waiting"  # Reserved for future use (e.g., waiting for resources, cooldowns)
 
 
+# Serialized form of each state, looked up without the Enum .value descriptor
+_STATE_VALUES: Dict[AIPlayerState, str] = {state: state.value for state in AIPlayerState}
+
+
 class AIPlayer:
     """
     Represents an AI-controlled player in the game.
@@ -25,6 +46,22 @@ class AIPlayer:
     extended with custom behavior.
     """
     
+    __slots__ = (
+        'id',
+        'name',
+        'resource_manager',
+        'difficulty',
+        'state',
+        '_elapsed',
+        '_next_decision_time',
+        '_decision_interval',
+        '_decision_hooks',
+        '_decision_cache',
+        '_action_queue',
+        'actions_taken',
+        'decisions_made',
+    )
+    
     def __init__(
         self,
         player_id: str,
@@ -44,15 +81,23 @@ class AIPlayer:
         self.id = player_id
         self.name = name
         self.resource_manager = resource_manager or ResourceManager(starting_money=10000.0)
-        self.difficulty = difficulty
+        self.difficulty = sys.intern(difficulty)
         
         # AI state
         self.state = AIPlayerState.IDLE
-        self._decision_timer = 0.0
         self._decision_interval = self._get_decision_interval()
         
+        # Time since creation and when the next decision is due; only the
+        # deadline moves when a decision is made
+        self._elapsed = 0.0
+        self._next_decision_time = self._decision_interval
+        
         # Decision hooks - functions that can be called during decision making
-        self._decision_hooks: List[Callable[[Any], Any]] = []
+        # (allocated on first add_decision_hook; most AI players have none)
+        self._decision_hooks: Optional[List[Callable[[Any], Any]]] = None
+        
+        # (state_key, actions) from the last decision made with a state_key
+        self._decision_cache: Optional[Tuple[Any, Tuple[Dict[str, Any], ...]]] = None
         
         # Action queue for planned actions
         self._action_queue: List[Dict[str, Any]] = []
@@ -63,53 +108,75 @@ class AIPlayer:
     
     def _get_decision_interval(self) -> float:
         """Get decision interval based on difficulty."""
-        intervals = {
-            "easy": 5.0,    # Decisions every 5 seconds
-            "medium": 3.0,  # Decisions every 3 seconds
-            "hard": 1.5     # Decisions every 1.5 seconds
-        }
-        return intervals.get(self.difficulty, 3.0)
+        return _DIFFICULTY_INTERVALS.get(self.difficulty, _DEFAULT_DECISION_INTERVAL)
     
-    def update(self, dt: float, game_state: Optional[Dict[str, Any]] = None) -> None:
+    def update(
+        self,
+        dt: float,
+        game_state: Optional[Dict[str, Any]] = None,
+        state_key: Any = None
+    ) -> None:
         """
         Update the AI player's decision loop.
         
         Args:
             dt: Delta time in seconds
             game_state: Optional game state information for decision making
+            state_key: Optional hashable summary of game_state; see _make_decision
         """
-        self._decision_timer += dt
+        self._elapsed += dt
         
         # Check if it's time to make a decision
-        if self._decision_timer >= self._decision_interval:
-            self._decision_timer -= self._decision_interval
-            self._make_decision(game_state)
+        if self._elapsed >= self._next_decision_time:
+            self._next_decision_time += self._decision_interval
+            self._make_decision(game_state, state_key)
         
         # Execute queued actions
         self._execute_actions(dt)
     
-    def _make_decision(self, game_state: Optional[Dict[str, Any]] = None) -> None:
+    def _make_decision(
+        self,
+        game_state: Optional[Dict[str, Any]] = None,
+        state_key: Any = None
+    ) -> None:
         """
         Make a decision based on current game state.
         
         This is a simple placeholder that calls registered hooks.
         Subclasses or custom hooks can implement actual AI logic.
         
+        When a state_key is given and matches the one from the previous
+        decision, the hooks are skipped and copies of their previous actions
+        are queued instead. Callers should only pass a state_key that changes
+        whenever the game state relevant to the hooks changes.
+        
         Args:
             game_state: Current game state for decision making
+            state_key: Optional hashable summary of game_state
         """
         self.state = AIPlayerState.PLANNING
         
-        # Call all decision hooks
-        for hook in self._decision_hooks:
-            action = hook(game_state)
-            if action:
-                self._action_queue.append(action)
+        hooks = self._decision_hooks
+        action_queue = self._action_queue
+        cache = self._decision_cache
+        if state_key is not None and cache is not None and cache[0] == state_key:
+            # Same state as last time: replay the cached actions
+            action_queue.extend(dict(action) for action in cache[1])
+        elif hooks:
+            # Call all decision hooks
+            actions = []
+            for hook in hooks:
+                action = hook(game_state)
+                if action:
+                    actions.append(action)
+            action_queue.extend(actions)
+            if state_key is not None:
+                self._decision_cache = (state_key, tuple(dict(action) for action in actions))
         
         self.decisions_made += 1
         
         # Transition to executing if we have actions
-        if self._action_queue:
+        if action_queue:
             self.state = AIPlayerState.EXECUTING
         else:
             self.state = AIPlayerState.IDLE
@@ -192,7 +259,10 @@ class AIPlayer:
         Args:
             hook: Function that takes game state and returns an action dict or None
         """
+        if self._decision_hooks is None:
+            self._decision_hooks = []
         self._decision_hooks.append(hook)
+        self._decision_cache = None
     
     def remove_decision_hook(self, hook: Callable[[Any], Any]) -> bool:
         """
@@ -204,8 +274,11 @@ class AIPlayer:
         Returns:
             True if removed, False if not found
         """
+        if self._decision_hooks is None:
+            return False
         try:
             self._decision_hooks.remove(hook)
+            self._decision_cache = None
             return True
         except ValueError:
             return False
@@ -234,7 +307,7 @@ class AIPlayer:
             'id': self.id,
             'name': self.name,
             'difficulty': self.difficulty,
-            'state': self.state.value,
+            'state': _STATE_VALUES[self.state],
             'actions_taken': self.actions_taken,
             'decisions_made': self.decisions_made,
             'queued_actions': len(self._action_queue),
@@ -247,11 +320,43 @@ class AIPlayerManager:
     Manages multiple AI players in the game.
     
     Provides centralized management and update loop for all AI players.
+    
+    Decision timing is tracked in a heap of deadlines, so each update only
+    touches the AI players whose next decision is due. AI players whose class
+    overrides update() are not scheduled; their update() is called every time.
     """
     
-    def __init__(self):
-        """Initialize the AI player manager."""
+    def __init__(self, parallel_hooks: bool = False, max_workers: int = 4):
+        """
+        Initialize the AI player manager.
+        
+        Args:
+            parallel_hooks: Run the decisions of AI players that are due in the
+                same update on a thread pool. Useful when decision hooks block
+                on I/O; hooks must then be safe to call from several threads.
+            max_workers: Maximum number of threads used when parallel_hooks is set
+        """
         self.ai_players: Dict[str, AIPlayer] = {}
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=max_workers) if parallel_hooks else None
+        )
+        
+        # Heap of (deadline, sequence, player_id); the sequence number breaks
+        # ties and identifies the live entry for each player (stale entries
+        # left by removals are skipped when popped). _heap_entries maps each
+        # scheduled player to its live (sequence, deadline).
+        self._sim_time = 0.0
+        self._deadline_heap: List[Tuple[float, int, str]] = []
+        self._heap_entries: Dict[str, Tuple[int, float]] = {}
+        self._sequence = itertools.count()
+        
+        # AI players with their own update(), called on every update_all
+        self._custom_updates: Dict[str, AIPlayer] = {}
+        
+        self._id_counter = itertools.count()
+        
+        # Snapshot returned by get_all_ai_players, rebuilt after changes
+        self._all_players_cache: Optional[Tuple[AIPlayer, ...]] = None
     
     def add_ai_player(self, ai_player: AIPlayer) -> bool:
         """
@@ -267,8 +372,28 @@ class AIPlayerManager:
             return False
         
         self.ai_players[ai_player.id] = ai_player
+        self._all_players_cache = None
+        if type(ai_player).update is not AIPlayer.update:
+            self._custom_updates[ai_player.id] = ai_player
+        else:
+            # Carry over the time already spent towards the next decision
+            time_left = ai_player._next_decision_time - ai_player._elapsed
+            self._schedule(ai_player.id, self._sim_time + time_left)
         return True
     
+    def _schedule(self, player_id: str, deadline: float) -> None:
+        """Push the next decision deadline for an AI player."""
+        sequence = next(self._sequence)
+        self._heap_entries[player_id] = (sequence, deadline)
+        heapq.heappush(self._deadline_heap, (deadline, sequence, player_id))
+    
+    def _unschedule(self, ai_player: AIPlayer) -> None:
+        """Stop tracking an AI player, handing its decision timer back to it."""
+        if self._custom_updates.pop(ai_player.id, None) is not None:
+            return
+        _, deadline = self._heap_entries.pop(ai_player.id)
+        ai_player._next_decision_time = ai_player._elapsed + (deadline - self._sim_time)
+    
     def remove_ai_player(self, player_id: str) -> bool:
         """
         Remove an AI player by ID.
@@ -279,10 +404,12 @@ class AIPlayerManager:
         Returns:
             True if removed, False if not found
         """
-        if player_id in self.ai_players:
-            del self.ai_players[player_id]
-            return True
-        return False
+        ai_player = self.ai_players.pop(player_id, None)
+        if ai_player is None:
+            return False
+        self._unschedule(ai_player)
+        self._all_players_cache = None
+        return True
     
     def get_ai_player(self, player_id: str) -> Optional[AIPlayer]:
         """
@@ -296,25 +423,101 @@ class AIPlayerManager:
         """
         return self.ai_players.get(player_id)
     
-    def get_all_ai_players(self) -> List[AIPlayer]:
+    def get_all_ai_players(self) -> Tuple[AIPlayer, ...]:
         """
         Get all AI players.
         
+        The tuple is cached until AI players are added or removed.
+        
         Returns:
-            List of all AI players
+            Tuple of all AI players
         """
-        return list(self.ai_players.values())
+        if self._all_players_cache is None:
+            self._all_players_cache = tuple(self.ai_players.values())
+        return self._all_players_cache
     
-    def update_all(self, dt: float, game_state: Optional[Dict[str, Any]] = None) -> None:
+    def update_all(
+        self,
+        dt: float,
+        game_state: Optional[Dict[str, Any]] = None,
+        state_key: Any = None
+    ) -> None:
         """
         Update all AI players.
         
+        Behaves like calling update() on every AI player: each player makes at
+        most one decision per call, then executes its queued actions. AI players
+        that override update() have it called directly.
+        
         Args:
             dt: Delta time in seconds
             game_state: Optional game state for decision making
+            state_key: Optional hashable summary of game_state, passed on to
+                each AI player's decision (see AIPlayer._make_decision)
+        """
+        self._sim_time += dt
+        heap = self._deadline_heap
+        
+        ai_players = self.ai_players
+        heap_entries = self._heap_entries
+        
+        # Pop every AI player whose decision is due
+        due_players = []
+        while heap and heap[0][0] <= self._sim_time:
+            deadline, sequence, player_id = heapq.heappop(heap)
+            ai_player = ai_players.get(player_id)
+            if ai_player is not None and heap_entries.get(player_id) == (sequence, deadline):
+                due_players.append((deadline, sequence, ai_player))
+        
+        def still_managed(deadline: float, sequence: int, ai_player: AIPlayer) -> bool:
+            # Decision hooks may remove (or replace) AI players
+            return (
+                ai_players.get(ai_player.id) is ai_player
+                and heap_entries.get(ai_player.id) == (sequence, deadline)
+            )
+        
+        if self._executor is not None and len(due_players) > 1:
+            # Each player only touches its own state, so decisions can overlap
+            futures = [
+                self._executor.submit(ai_player._make_decision, game_state, state_key)
+                for _, _, ai_player in due_players
+            ]
+            for future in futures:
+                future.result()
+        else:
+            for deadline, sequence, ai_player in due_players:
+                if still_managed(deadline, sequence, ai_player):
+                    ai_player._make_decision(game_state, state_key)
+        
+        for deadline, sequence, ai_player in due_players:
+            if still_managed(deadline, sequence, ai_player):
+                self._schedule(ai_player.id, deadline + ai_player._decision_interval)
+        
+        custom_updates = self._custom_updates
+        if custom_updates:
+            for ai_player in tuple(custom_updates.values()):
+                if custom_updates.get(ai_player.id) is ai_player:
+                    ai_player.update(dt, game_state, state_key)
+        
+        # Execute queued actions; idle players are filtered out at C level
+        for ai_player in filter(_has_queued_actions, ai_players.values()):
+            if ai_player.id not in custom_updates:
+                ai_player._execute_actions(dt)
+    
+    def generate_id(self, prefix: str = "ai") -> str:
         """
-        for ai_player in self.ai_players.values():
-            ai_player.update(dt, game_state)
+        Generate a unique AI player ID.
+        
+        Args:
+            prefix: ID prefix
+            
+        Returns:
+            An ID not used by any managed AI player
+        """
+        player_id = f"{prefix}_{next(self._id_counter)}"
+        while player_id in self.ai_players:
+            player_id = f"{prefix}_{next(self._id_counter)}"
+        return player_id
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -338,4 +541,14 @@ class AIPlayerManager:
     
     def clear(self) -> None:
         """Remove all AI players."""
+        for ai_player in self.ai_players.values():
+            self._unschedule(ai_player)
         self.ai_players.clear()
+        self._deadline_heap.clear()
+        self._all_players_cache = None
+    
+    def shutdown(self) -> None:
+        """Stop the hook thread pool, if parallel_hooks was enabled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -5,16 +5,21 @@ Provides a basic resource model with income/expense tracking and configurable pa
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Optional, Tuple
 from ..entities.resources import ResourceManager
 
 
-@dataclass
+@dataclass(frozen=True)
 class EconomyConfig:
     """
     Configuration for the economy system.
     
     This allows parameterization of economic behavior for different game types.
+    
+    The config is immutable so EconomySystem can cache its values. To change
+    rates at runtime, assign a modified copy to the system, e.g.
+    ``economy.config = dataclasses.replace(economy.config, tax_rate=0.2)``.
+    Custom parameters remain mutable.
     """
     
     # Base rates
@@ -48,6 +53,24 @@ class EconomySystem:
     with hooks for expansion.
     """
     
+    __slots__ = (
+        'resource_manager',
+        '_config',
+        '_tick_interval',
+        '_base_income_rate',
+        '_base_expense_rate',
+        '_after_tax',
+        '_interest_rate',
+        '_accumulated_time',
+        '_income_modifiers',
+        '_expense_modifiers',
+        '_income_chain',
+        '_expense_chain',
+        'total_income',
+        'total_expenses',
+        'tick_count',
+    )
+    
     def __init__(self, resource_manager: ResourceManager, config: Optional[EconomyConfig] = None):
         """
         Initialize the economy system.
@@ -62,15 +85,34 @@ class EconomySystem:
         # Track time for tick-based updates
         self._accumulated_time = 0.0
         
-        # Hooks for custom income/expense calculations
-        self._income_modifiers: List[Callable[[float], float]] = []
-        self._expense_modifiers: List[Callable[[float], float]] = []
+        # Hooks for custom income/expense calculations. The dicts (used as
+        # ordered sets) give O(1) removal; the tuples are immutable snapshots
+        # rebuilt on change that the tick path iterates.
+        self._income_modifiers: Dict[Callable[[float], float], None] = {}
+        self._expense_modifiers: Dict[Callable[[float], float], None] = {}
+        self._income_chain: Tuple[Callable[[float], float], ...] = ()
+        self._expense_chain: Tuple[Callable[[float], float], ...] = ()
         
         # Statistics tracking
         self.total_income = 0.0
         self.total_expenses = 0.0
         self.tick_count = 0
     
+    @property
+    def config(self) -> EconomyConfig:
+        """Economy configuration."""
+        return self._config
+    
+    @config.setter
+    def config(self, config: EconomyConfig) -> None:
+        """Replace the configuration and cache the values read every tick."""
+        self._config = config
+        self._tick_interval = config.tick_interval
+        self._base_income_rate = config.base_income_rate
+        self._base_expense_rate = config.base_expense_rate
+        self._after_tax = 1.0 - config.tax_rate
+        self._interest_rate = config.interest_rate
+    
     def update(self, dt: float) -> None:
         """
         Update the economy system.
@@ -78,53 +120,86 @@ class EconomySystem:
         Args:
             dt: Delta time in seconds
         """
-        self._accumulated_time += dt
+        accumulated_time = self._accumulated_time + dt
+        tick_interval = self._tick_interval
+        
+        # Fast path: most frames end between ticks
+        if accumulated_time < tick_interval:
+            self._accumulated_time = accumulated_time
+            return
         
-        # Process economic ticks
-        while self._accumulated_time >= self.config.tick_interval:
-            self._accumulated_time -= self.config.tick_interval
-            self._process_tick()
+        # Split into whole ticks and the exact leftover in one step rather
+        # than subtracting the interval once per tick
+        ticks, self._accumulated_time = divmod(accumulated_time, tick_interval)
+        self._process_ticks(int(ticks))
     
-    def _process_tick(self) -> None:
-        """Process a single economic tick."""
-        # Calculate income
-        income = self._calculate_income()
+    def _process_ticks(self, ticks: int) -> None:
+        """
+        Process a number of economic ticks.
+        
+        Income and expense modifiers are evaluated once for the whole batch;
+        only interest depends on the balance left by the previous tick. The
+        net change is applied to the resource manager in a single call.
         
-        # Calculate expenses
+        Args:
+            ticks: Number of ticks to process
+        """
+        base_income = self._calculate_base_income()
         expenses = self._calculate_expenses()
+        interest_rate = self._interest_rate
+        
+        if interest_rate:
+            # Interest compounds, so walk the ticks on a local balance
+            money = self.resource_manager.get_money()
+            total_income = 0.0
+            net_change = 0.0
+            for _ in range(ticks):
+                # Apply interest on current savings (interest_rate is per tick)
+                income = base_income + money * interest_rate
+                money += income - expenses
+                total_income += income
+                net_change += income - expenses
+        else:
+            total_income = ticks * base_income
+            net_change = ticks * (base_income - expenses)
         
         # Apply to resource manager
-        net_change = income - expenses
         self.resource_manager.add_money(net_change)
         
         # Update statistics
-        self.total_income += income
-        self.total_expenses += expenses
-        self.tick_count += 1
+        self.total_income += total_income
+        self.total_expenses += ticks * expenses
+        self.tick_count += ticks
     
-    def _calculate_income(self) -> float:
+    def _calculate_base_income(self) -> float:
         """
-        Calculate income for this tick.
+        Calculate income for a tick before interest.
         
         Returns:
-            Income amount after taxes and modifiers
+            Income amount after modifiers and taxes
         """
         # Start with base income
-        income = self.config.base_income_rate
+        income = self._base_income_rate
         
         # Apply income modifiers (e.g., from buildings, upgrades)
-        for modifier in self._income_modifiers:
-            income = modifier(income)
+        modifiers = self._income_chain
+        if modifiers:
+            for modifier in modifiers:
+                income = modifier(income)
         
         # Apply tax
-        income *= (1.0 - self.config.tax_rate)
+        return income * self._after_tax
+    
+    def _calculate_income(self) -> float:
+        """
+        Calculate income for this tick.
         
+        Returns:
+            Income amount after taxes and modifiers
+        """
         # Apply interest on current savings (interest_rate is per tick)
-        current_money = self.resource_manager.get_money()
-        interest = current_money * self.config.interest_rate
-        income += interest
-        
-        return income
+        interest = self.resource_manager.get_money() * self._interest_rate
+        return self._calculate_base_income() + interest
     
     def _calculate_expenses(self) -> float:
         """
@@ -134,11 +209,13 @@ class EconomySystem:
             Expense amount after modifiers
         """
         # Start with base expenses
-        expenses = self.config.base_expense_rate
+        expenses = self._base_expense_rate
         
         # Apply expense modifiers (e.g., maintenance costs)
-        for modifier in self._expense_modifiers:
-            expenses = modifier(expenses)
+        modifiers = self._expense_chain
+        if modifiers:
+            for modifier in modifiers:
+                expenses = modifier(expenses)
         
         return expenses
     
@@ -148,11 +225,18 @@ class EconomySystem:
         
         The modifier should take the current income value and return the modified value.
         This provides a hook for game-specific income calculations.
+        Adding a modifier that is already registered has no effect.
+        
+        Modifiers are called once per update() that processes ticks, not once
+        per tick: when a long frame covers several ticks, the value returned is
+        used for all of them. Modifiers should therefore depend on the income
+        passed in and on game state, not on how often they are called.
         
         Args:
             modifier: Function that takes income float and returns modified income float
         """
-        self._income_modifiers.append(modifier)
+        self._income_modifiers[modifier] = None
+        self._income_chain = tuple(self._income_modifiers)
     
     def add_expense_modifier(self, modifier: Callable[[float], float]) -> None:
         """
@@ -160,11 +244,18 @@ class EconomySystem:
         
         The modifier should take the current expense value and return the modified value.
         This provides a hook for game-specific expense calculations.
+        Adding a modifier that is already registered has no effect.
+        
+        Modifiers are called once per update() that processes ticks, not once
+        per tick: when a long frame covers several ticks, the value returned is
+        used for all of them. Modifiers should therefore depend on the expense
+        passed in and on game state, not on how often they are called.
         
         Args:
             modifier: Function that takes expense float and returns modified expense float
         """
-        self._expense_modifiers.append(modifier)
+        self._expense_modifiers[modifier] = None
+        self._expense_chain = tuple(self._expense_modifiers)
     
     def remove_income_modifier(self, modifier: Callable[[float], float]) -> bool:
         """
@@ -176,11 +267,11 @@ class EconomySystem:
         Returns:
             True if removed, False if not found
         """
-        try:
-            self._income_modifiers.remove(modifier)
-            return True
-        except ValueError:
+        if modifier not in self._income_modifiers:
             return False
+        del self._income_modifiers[modifier]
+        self._income_chain = tuple(self._income_modifiers)
+        return True
     
     def remove_expense_modifier(self, modifier: Callable[[float], float]) -> bool:
         """
@@ -192,11 +283,11 @@ class EconomySystem:
         Returns:
             True if removed, False if not found
         """
-        try:
-            self._expense_modifiers.remove(modifier)
-            return True
-        except ValueError:
+        if modifier not in self._expense_modifiers:
             return False
+        del self._expense_modifiers[modifier]
+        self._expense_chain = tuple(self._expense_modifiers)
+        return True
     
     def get_net_income_rate(self) -> float:
         """
@@ -5,10 +5,15 @@ Provides a nodes and edges system for representing game worlds with
 spatial relationships and connections.
 """
 
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
 import math
 
 
+# Maximum number of find_path results kept per map
+PATH_CACHE_SIZE = 4096
+
+
 class Node:
     """
     Represents a node in the world map.
@@ -17,6 +22,8 @@ class Node:
     in the game world.
     """
     
+    __slots__ = ('_id', 'x', 'y', 'type', '_properties', '_connected_edges', '_world_map')
+    
     def __init__(self, node_id: str, x: float, y: float, node_type: str = "default"):
         """
         Initialize a node.
@@ -27,16 +34,30 @@ class Node:
             y: Y position in world coordinates
             node_type: Type classification (e.g., 'city', 'resource', 'hub')
         """
-        self.id = node_id
+        self._id = node_id
         self.x = x
         self.y = y
         self.type = node_type
         
-        # Custom properties for game-specific data
-        self.properties: Dict[str, Any] = {}
+        # Custom properties for game-specific data, allocated on first use
+        self._properties: Optional[Dict[str, Any]] = None
         
-        # Track connected edges
-        self._connected_edges: List[str] = []
+        # Track connected edges (a dict used as an ordered set)
+        self._connected_edges: Dict[str, None] = {}
+        
+        # WorldMap holding this node, whose path cache changes invalidate
+        self._world_map: Optional["WorldMap"] = None
+    
+    @property
+    def id(self) -> str:
+        """Unique identifier for this node."""
+        return self._id
+    
+    @id.setter
+    def id(self, node_id: str) -> None:
+        """Set the ID, invalidating the path cache of the map holding the node."""
+        self._id = node_id
+        _invalidate_paths(self._world_map)
     
     def get_position(self) -> Tuple[float, float]:
         """Get node position as tuple."""
@@ -57,13 +78,25 @@ class Node:
         Returns:
             Distance between nodes
         """
-        dx = self.x - other.x
-        dy = self.y - other.y
-        return math.sqrt(dx * dx + dy * dy)
+        return math.hypot(self.x - other.x, self.y - other.y)
+    
+    @property
+    def properties(self) -> Dict[str, Any]:
+        """Custom properties for game-specific data."""
+        if self._properties is None:
+            self._properties = {}
+        return self._properties
+    
+    @properties.setter
+    def properties(self, properties: Dict[str, Any]) -> None:
+        """Replace the custom properties."""
+        self._properties = properties
     
     def get_property(self, key: str, default: Any = None) -> Any:
         """Get a custom property."""
-        return self.properties.get(key, default)
+        if self._properties is None:
+            return default
+        return self._properties.get(key, default)
     
     def set_property(self, key: str, value: Any) -> None:
         """Set a custom property."""
@@ -76,8 +109,8 @@ class Node:
         Args:
             edge_id: ID of the connecting edge
         """
-        if edge_id not in self._connected_edges:
-            self._connected_edges.append(edge_id)
+        self._connected_edges[edge_id] = None
+        _invalidate_paths(self._world_map)
     
     def remove_edge(self, edge_id: str) -> bool:
         """
@@ -89,15 +122,15 @@ class Node:
         Returns:
             True if removed, False if not found
         """
-        try:
-            self._connected_edges.remove(edge_id)
-            return True
-        except ValueError:
+        if edge_id not in self._connected_edges:
             return False
+        del self._connected_edges[edge_id]
+        _invalidate_paths(self._world_map)
+        return True
     
     def get_connected_edges(self) -> List[str]:
         """Get list of connected edge IDs."""
-        return self._connected_edges.copy()
+        return list(self._connected_edges)
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize node to dictionary."""
@@ -106,8 +139,8 @@ class Node:
             'x': self.x,
             'y': self.y,
             'type': self.type,
-            'properties': self.properties.copy(),
-            'connected_edges': self._connected_edges.copy()
+            'properties': dict(self._properties) if self._properties else {},
+            'connected_edges': list(self._connected_edges)
         }
     
     @classmethod
@@ -119,8 +152,8 @@ class Node:
             y=data['y'],
             node_type=data.get('type', 'default')
         )
-        node.properties = data.get('properties', {}).copy()
-        node._connected_edges = data.get('connected_edges', []).copy()
+        node._properties = dict(data['properties']) if data.get('properties') else None
+        node._connected_edges = dict.fromkeys(data.get('connected_edges', []))
         return node
 
 
@@ -132,6 +165,11 @@ class Edge:
     between nodes with throughput capacity.
     """
     
+    __slots__ = (
+        'id', '_from_node_id', '_to_node_id', 'throughput', '_bidirectional',
+        'current_flow', '_properties', '_world_map'
+    )
+    
     def __init__(
         self,
         edge_id: str,
@@ -151,16 +189,55 @@ class Edge:
             bidirectional: Whether edge can be traversed in both directions
         """
         self.id = edge_id
-        self.from_node_id = from_node_id
-        self.to_node_id = to_node_id
+        self._from_node_id = from_node_id
+        self._to_node_id = to_node_id
         self.throughput = throughput
-        self.bidirectional = bidirectional
+        self._bidirectional = bidirectional
         
         # Current flow through this edge
         self.current_flow = 0.0
         
-        # Custom properties for game-specific data
-        self.properties: Dict[str, Any] = {}
+        # Custom properties for game-specific data, allocated on first use
+        self._properties: Optional[Dict[str, Any]] = None
+        
+        # WorldMap holding this edge, whose path cache changes invalidate
+        self._world_map: Optional["WorldMap"] = None
+    
+    # Endpoints and direction decide which paths exist, so changing them
+    # invalidates the path cache of the map holding the edge
+    
+    @property
+    def from_node_id(self) -> str:
+        """ID of the source node."""
+        return self._from_node_id
+    
+    @from_node_id.setter
+    def from_node_id(self, node_id: str) -> None:
+        """Set the source node ID."""
+        self._from_node_id = node_id
+        _invalidate_paths(self._world_map)
+    
+    @property
+    def to_node_id(self) -> str:
+        """ID of the destination node."""
+        return self._to_node_id
+    
+    @to_node_id.setter
+    def to_node_id(self, node_id: str) -> None:
+        """Set the destination node ID."""
+        self._to_node_id = node_id
+        _invalidate_paths(self._world_map)
+    
+    @property
+    def bidirectional(self) -> bool:
+        """Whether the edge can be traversed in both directions."""
+        return self._bidirectional
+    
+    @bidirectional.setter
+    def bidirectional(self, bidirectional: bool) -> None:
+        """Set whether the edge can be traversed in both directions."""
+        self._bidirectional = bidirectional
+        _invalidate_paths(self._world_map)
     
     def get_capacity_remaining(self) -> float:
         """
@@ -225,7 +302,7 @@ class Edge:
         Returns:
             True if edge connects to the node
         """
-        return node_id == self.from_node_id or node_id == self.to_node_id
+        return node_id == self._from_node_id or node_id == self._to_node_id
     
     def get_other_node(self, node_id: str) -> Optional[str]:
         """
@@ -237,15 +314,29 @@ class Edge:
         Returns:
             ID of the other node, or None if node_id is not connected
         """
-        if node_id == self.from_node_id:
-            return self.to_node_id
-        elif node_id == self.to_node_id:
-            return self.from_node_id if self.bidirectional else None
+        if node_id == self._from_node_id:
+            return self._to_node_id
+        elif node_id == self._to_node_id:
+            return self._from_node_id if self._bidirectional else None
         return None
     
+    @property
+    def properties(self) -> Dict[str, Any]:
+        """Custom properties for game-specific data."""
+        if self._properties is None:
+            self._properties = {}
+        return self._properties
+    
+    @properties.setter
+    def properties(self, properties: Dict[str, Any]) -> None:
+        """Replace the custom properties."""
+        self._properties = properties
+    
     def get_property(self, key: str, default: Any = None) -> Any:
         """Get a custom property."""
-        return self.properties.get(key, default)
+        if self._properties is None:
+            return default
+        return self._properties.get(key, default)
     
     def set_property(self, key: str, value: Any) -> None:
         """Set a custom property."""
@@ -260,7 +351,7 @@ class Edge:
             'throughput': self.throughput,
             'bidirectional': self.bidirectional,
             'current_flow': self.current_flow,
-            'properties': self.properties.copy()
+            'properties': dict(self._properties) if self._properties else {}
         }
     
     @classmethod
@@ -274,15 +365,104 @@ class Edge:
             bidirectional=data.get('bidirectional', True)
         )
         edge.current_flow = data.get('current_flow', 0.0)
-        edge.properties = data.get('properties', {}).copy()
+        edge._properties = dict(data['properties']) if data.get('properties') else None
         return edge
 
 
+def _invalidate_paths(world_map: Optional["WorldMap"]) -> None:
+    """Clear the path cache of the map holding a node or edge, if any."""
+    if world_map is not None:
+        world_map.invalidate_path_cache()
+
+
+def _set_world_map(item: Any, world_map: Optional["WorldMap"]) -> None:
+    """Record which map holds a node or edge (other values are left alone)."""
+    if isinstance(item, (Node, Edge)):
+        item._world_map = world_map
+
+
+class _GraphDict(dict):
+    """
+    Dict of a WorldMap's nodes or edges.
+    
+    Any change clears the map's path cache, and items record the map holding
+    them so their own path-relevant changes can clear it too.
+    """
+    
+    __slots__ = ('_world_map',)
+    
+    def __init__(self, world_map: "WorldMap", items: Any = ()):
+        super().__init__()
+        self._world_map = world_map
+        self.update(items)
+    
+    def _release(self, item: Any) -> None:
+        """Forget this map on an item leaving the dict."""
+        if getattr(item, '_world_map', None) is getattr(self, '_world_map', None):
+            _set_world_map(item, None)
+    
+    def _changed(self) -> None:
+        """Clear the owning map's path cache."""
+        _invalidate_paths(getattr(self, '_world_map', None))
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        old = self.get(key)
+        if old is not None and old is not value:
+            self._release(old)
+        super().__setitem__(key, value)
+        _set_world_map(value, getattr(self, '_world_map', None))
+        self._changed()
+    
+    def __delitem__(self, key: Any) -> None:
+        self._release(self[key])
+        super().__delitem__(key)
+        self._changed()
+    
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        value = super().pop(key)
+        self._release(value)
+        self._changed()
+        return value
+    
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self._release(item[1])
+        self._changed()
+        return item
+    
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def __ior__(self, other: Any) -> "_GraphDict":
+        self.update(other)
+        return self
+    
+    def clear(self) -> None:
+        for value in self.values():
+            self._release(value)
+        super().clear()
+        self._changed()
+
+
 class WorldMap:
     """
     Manages the world map with nodes and edges.
     
     Provides graph-based world representation with spatial information.
+    
+    find_path results are cached. The cache is invalidated whenever the
+    nodes or edges dicts change (including direct item assignment), or a
+    node's ID, connected edges, or an edge's endpoints or direction change.
+    Code that changes the graph some other way should call
+    invalidate_path_cache().
     """
     
     def __init__(self, map_id: str = "default"):
@@ -293,8 +473,48 @@ class WorldMap:
             map_id: Unique identifier for this map
         """
         self.id = map_id
-        self.nodes: Dict[str, Node] = {}
-        self.edges: Dict[str, Edge] = {}
+        
+        # find_path results by (start, goal), least recently used first.
+        # Cleared by invalidate_path_cache whenever the graph changes.
+        self._path_cache: "OrderedDict[Tuple[str, str], Optional[List[str]]]" = OrderedDict()
+        
+        # Nodes and edges by ID; changes to these dicts invalidate the cache
+        self._nodes: Dict[str, Node] = _GraphDict(self)
+        self._edges: Dict[str, Edge] = _GraphDict(self)
+        
+        # Counters for generate_node_id/generate_edge_id
+        self._next_node_id = 0
+        self._next_edge_id = 0
+    
+    @property
+    def nodes(self) -> Dict[str, Node]:
+        """Nodes by ID."""
+        return self._nodes
+    
+    @nodes.setter
+    def nodes(self, nodes: Dict[str, Node]) -> None:
+        """Replace all nodes."""
+        self._nodes.clear()
+        self._nodes.update(nodes)
+    
+    @property
+    def edges(self) -> Dict[str, Edge]:
+        """Edges by ID."""
+        return self._edges
+    
+    @edges.setter
+    def edges(self, edges: Dict[str, Edge]) -> None:
+        """Replace all edges."""
+        self._edges.clear()
+        self._edges.update(edges)
+    
+    def invalidate_path_cache(self) -> None:
+        """
+        Forget cached find_path results.
+        
+        Called automatically for the changes listed in the class docstring.
+        """
+        self._path_cache.clear()
     
     def add_node(self, node: Node) -> bool:
         """
@@ -306,10 +526,10 @@ class WorldMap:
         Returns:
             True if added, False if ID already exists
         """
-        if node.id in self.nodes:
+        if node.id in self._nodes:
             return False
         
-        self.nodes[node.id] = node
+        self._nodes[node.id] = node
         return True
     
     def remove_node(self, node_id: str) -> bool:
@@ -324,15 +544,15 @@ class WorldMap:
         Returns:
             True if removed, False if not found
         """
-        if node_id not in self.nodes:
+        if node_id not in self._nodes:
             return False
         
         # Get connected edges before removing node
-        node = self.nodes[node_id]
+        node = self._nodes[node_id]
         edges_to_remove = node.get_connected_edges()
         
         # Remove the node
-        del self.nodes[node_id]
+        del self._nodes[node_id]
         
         # Remove connected edges
         for edge_id in edges_to_remove:
@@ -340,6 +560,38 @@ class WorldMap:
         
         return True
     
+    def generate_node_id(self, prefix: str = "node") -> str:
+        """
+        Generate a node ID that is not used in this map.
+        
+        Args:
+            prefix: ID prefix
+            
+        Returns:
+            ID of the form '<prefix>_<n>'
+        """
+        while True:
+            node_id = f"{prefix}_{self._next_node_id}"
+            self._next_node_id += 1
+            if node_id not in self._nodes:
+                return node_id
+    
+    def generate_edge_id(self, prefix: str = "edge") -> str:
+        """
+        Generate an edge ID that is not used in this map.
+        
+        Args:
+            prefix: ID prefix
+            
+        Returns:
+            ID of the form '<prefix>_<n>'
+        """
+        while True:
+            edge_id = f"{prefix}_{self._next_edge_id}"
+            self._next_edge_id += 1
+            if edge_id not in self._edges:
+                return edge_id
+    
     def get_node(self, node_id: str) -> Optional[Node]:
         """
         Get a node by ID.
@@ -350,7 +602,7 @@ class WorldMap:
         Returns:
             Node or None if not found
         """
-        return self.nodes.get(node_id)
+        return self._nodes.get(node_id)
     
     def add_edge(self, edge: Edge) -> bool:
         """
@@ -363,20 +615,19 @@ class WorldMap:
             True if added, False if ID already exists or nodes don't exist
         """
         # Check if edge ID already exists
-        if edge.id in self.edges:
+        if edge.id in self._edges:
             return False
         
         # Check if both nodes exist
-        if edge.from_node_id not in self.nodes or edge.to_node_id not in self.nodes:
+        if edge.from_node_id not in self._nodes or edge.to_node_id not in self._nodes:
             return False
         
         # Add edge
-        self.edges[edge.id] = edge
+        self._edges[edge.id] = edge
         
         # Register edge with nodes
-        self.nodes[edge.from_node_id].add_edge(edge.id)
-        self.nodes[edge.to_node_id].add_edge(edge.id)
-        
+        self._nodes[edge.from_node_id].add_edge(edge.id)
+        self._nodes[edge.to_node_id].add_edge(edge.id)
         return True
     
     def remove_edge(self, edge_id: str) -> bool:
@@ -389,19 +640,19 @@ class WorldMap:
         Returns:
             True if removed, False if not found
         """
-        if edge_id not in self.edges:
+        if edge_id not in self._edges:
             return False
         
-        edge = self.edges[edge_id]
+        edge = self._edges[edge_id]
         
         # Remove edge reference from nodes
-        if edge.from_node_id in self.nodes:
-            self.nodes[edge.from_node_id].remove_edge(edge_id)
-        if edge.to_node_id in self.nodes:
-            self.nodes[edge.to_node_id].remove_edge(edge_id)
+        if edge.from_node_id in self._nodes:
+            self._nodes[edge.from_node_id].remove_edge(edge_id)
+        if edge.to_node_id in self._nodes:
+            self._nodes[edge.to_node_id].remove_edge(edge_id)
         
         # Remove edge
-        del self.edges[edge_id]
+        del self._edges[edge_id]
         
         return True
     
@@ -415,7 +666,7 @@ class WorldMap:
         Returns:
             Edge or None if not found
         """
-        return self.edges.get(edge_id)
+        return self._edges.get(edge_id)
     
     def get_edges_from_node(self, node_id: str) -> List[Edge]:
         """
@@ -427,15 +678,12 @@ class WorldMap:
         Returns:
             List of edges connected to the node
         """
-        node = self.nodes.get(node_id)
+        node = self._nodes.get(node_id)
         if not node:
             return []
         
-        return [
-            self.edges[edge_id]
-            for edge_id in node.get_connected_edges()
-            if edge_id in self.edges
-        ]
+        edges = self._edges
+        return [edges[edge_id] for edge_id in node._connected_edges if edge_id in edges]
     
     def get_neighbors(self, node_id: str) -> List[Node]:
         """
@@ -448,34 +696,193 @@ class WorldMap:
             List of neighboring nodes
         """
         edges = self.get_edges_from_node(node_id)
+        nodes = self._nodes
         neighbors = []
         
         for edge in edges:
-            other_node_id = edge.get_other_node(node_id)
-            if other_node_id and other_node_id in self.nodes:
-                neighbors.append(self.nodes[other_node_id])
+            other_node = nodes.get(edge.get_other_node(node_id))
+            if other_node is not None:
+                neighbors.append(other_node)
         
         return neighbors
     
+    def get_nodes_in_radius(self, x: float, y: float, radius: float) -> List[Node]:
+        """
+        Get all nodes within a distance of a point.
+        
+        Args:
+            x: X coordinate of the center
+            y: Y coordinate of the center
+            radius: Maximum distance from the center (inclusive)
+            
+        Returns:
+            List of nodes within the radius
+        """
+        # Compare squared distances to avoid a square root per node
+        radius_sq = radius * radius
+        result = []
+        for node in self._nodes.values():
+            dx = node.x - x
+            dy = node.y - y
+            if dx * dx + dy * dy <= radius_sq:
+                result.append(node)
+        return result
+    
+    def find_path(self, start_id: str, goal_id: str) -> Optional[List[str]]:
+        """
+        Find a path with the fewest edges between two nodes.
+        
+        One-way edges are only followed from their from-node. Results are
+        cached until the graph changes (see the class docstring and
+        invalidate_path_cache).
+        
+        Args:
+            start_id: ID of the start node
+            goal_id: ID of the goal node
+            
+        Returns:
+            List of node IDs from start to goal (inclusive), or None if either
+            node doesn't exist or the goal can't be reached
+        """
+        if start_id not in self._nodes or goal_id not in self._nodes:
+            return None
+        if start_id == goal_id:
+            return [start_id]
+        
+        cache = self._path_cache
+        key = (start_id, goal_id)
+        if key in cache:
+            cache.move_to_end(key)
+            path = cache[key]
+        else:
+            path = self._compute_path(start_id, goal_id)
+            cache[key] = path
+            if len(cache) > PATH_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        # Callers get their own copy of the cached path
+        return list(path) if path is not None else None
+    
+    def _compute_path(self, start_id: str, goal_id: str) -> Optional[List[str]]:
+        """
+        Bidirectional breadth-first search for the shortest path (in edges).
+        
+        Searches forward from the start and backward from the goal, always
+        expanding the smaller frontier by one full level, so far fewer nodes
+        are visited than with a one-sided search on large maps.
+        """
+        # Node ID -> (parent ID, distance in edges) for each side
+        forward: Dict[str, Tuple[Optional[str], int]] = {start_id: (None, 0)}
+        backward: Dict[str, Tuple[Optional[str], int]] = {goal_id: (None, 0)}
+        forward_frontier = [start_id]
+        backward_frontier = [goal_id]
+        
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting = self._expand_level(
+                    forward_frontier, forward, backward, self._next_nodes
+                )
+            else:
+                backward_frontier, meeting = self._expand_level(
+                    backward_frontier, backward, forward, self._previous_nodes
+                )
+            
+            if meeting is not None:
+                # Start -> meeting node, then meeting node -> goal
+                path = [meeting]
+                while forward[path[-1]][0] is not None:
+                    path.append(forward[path[-1]][0])
+                path.reverse()
+                node_id = meeting
+                while backward[node_id][0] is not None:
+                    node_id = backward[node_id][0]
+                    path.append(node_id)
+                return path
+        
+        return None
+    
+    def _expand_level(
+        self,
+        frontier: List[str],
+        visited: Dict[str, Tuple[Optional[str], int]],
+        other_visited: Dict[str, Tuple[Optional[str], int]],
+        adjacent: Callable[[str], List[str]]
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        Expand one BFS level of one side of a bidirectional search.
+        
+        Args:
+            frontier: Nodes at the current search depth
+            visited: Parent and distance of nodes reached by this side
+            other_visited: Parent and distance of nodes reached by the other side
+            adjacent: Returns the nodes this side can step to from a node
+            
+        Returns:
+            The next frontier and the node where the two searches meet with
+            the shortest total distance, or None if they didn't meet
+        """
+        next_frontier = []
+        meeting = None
+        best = 0
+        depth = visited[frontier[0]][1] + 1
+        
+        for node_id in frontier:
+            for next_id in adjacent(node_id):
+                if next_id in visited:
+                    continue
+                visited[next_id] = (node_id, depth)
+                next_frontier.append(next_id)
+                other = other_visited.get(next_id)
+                if other is not None and (meeting is None or depth + other[1] < best):
+                    meeting = next_id
+                    best = depth + other[1]
+        
+        return next_frontier, meeting
+    
+    def _next_nodes(self, node_id: str) -> List[str]:
+        """Get IDs of the nodes reachable from a node over one edge."""
+        nodes = self._nodes
+        result = []
+        for edge in self.get_edges_from_node(node_id):
+            next_id = edge.get_other_node(node_id)
+            if next_id in nodes:
+                result.append(next_id)
+        return result
+    
+    def _previous_nodes(self, node_id: str) -> List[str]:
+        """Get IDs of the nodes that can reach a node over one edge."""
+        nodes = self._nodes
+        result = []
+        for edge in self.get_edges_from_node(node_id):
+            if edge._to_node_id == node_id:
+                previous_id = edge._from_node_id
+            elif edge._bidirectional:
+                previous_id = edge._to_node_id
+            else:
+                continue
+            if previous_id in nodes:
+                result.append(previous_id)
+        return result
+    
     def get_all_nodes(self) -> List[Node]:
         """Get all nodes in the map."""
-        return list(self.nodes.values())
+        return list(self._nodes.values())
     
     def get_all_edges(self) -> List[Edge]:
         """Get all edges in the map."""
-        return list(self.edges.values())
+        return list(self._edges.values())
     
     def clear(self) -> None:
         """Remove all nodes and edges from the map."""
-        self.nodes.clear()
-        self.edges.clear()
+        self._nodes.clear()
+        self._edges.clear()
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize world map to dictionary."""
         return {
             'id': self.id,
-            'nodes': {node_id: node.to_dict() for node_id, node in self.nodes.items()},
-            'edges': {edge_id: edge.to_dict() for edge_id, edge in self.edges.items()}
+            'nodes': {node_id: node.to_dict() for node_id, node in self._nodes.items()},
+            'edges': {edge_id: edge.to_dict() for edge_id, edge in self._edges.items()}
         }
     
     @classmethod
@@ -67,12 +67,21 @@ class UIComponent:
         """
         return False
     
-    def is_hovered(self) -> bool:
-        """Check if mouse is hovering over component."""
+    def is_hovered(self, pos: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Check if mouse is hovering over component.
+        
+        Args:
+            pos: Mouse position to test (defaults to the current mouse position)
+            
+        Returns:
+            True if the position is over the visible, enabled component
+        """
         if not self.visible or not self.enabled:
             return False
-        mouse_pos = pygame.mouse.get_pos()
-        return self.rect.collidepoint(mouse_pos)
+        if pos is None:
+            pos = pygame.mouse.get_pos()
+        return self.rect.collidepoint(pos)
 
 
 class Label(UIComponent):
@@ -240,7 +249,7 @@ class Button(UIComponent):
             return False
         
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-            if self.is_hovered():
+            if self.is_hovered(getattr(event, 'pos', None)):
                 if self.callback:
                     self.callback()
                 return True
@@ -486,6 +495,10 @@ class TextInput(UIComponent):
         
         # Load font
         self.font = pygame.font.Font(font_path, font_size)
+        
+        # Rendered text, reused until the text, color or font changes
+        self._text_surface: Optional[pygame.Surface] = None
+        self._text_surface_key: Optional[tuple] = None
     
     def update(self, dt: float) -> None:
         """Update cursor blink animation."""
@@ -509,11 +522,18 @@ class TextInput(UIComponent):
         
         # Draw text or placeholder
         if self.text:
-            text_surface = self.font.render(self.text, True, self.text_color)
+            content, color = self.text, self.text_color
         elif self.placeholder and not self.active:
-            text_surface = self.font.render(self.placeholder, True, self.placeholder_color)
+            content, color = self.placeholder, self.placeholder_color
         else:
-            text_surface = self.font.render("", True, self.text_color)
+            content, color = "", self.text_color
+        
+        # Only re-render the text when it changed since the last frame
+        key = (content, color, self.font)
+        if key != self._text_surface_key:
+            self._text_surface = self.font.render(content, True, color)
+            self._text_surface_key = key
+        text_surface = self._text_surface
         
         # Position text with padding
         text_rect = text_surface.get_rect(midleft=(self.rect.x + 5, self.rect.centery))
@@ -533,7 +553,7 @@ class TextInput(UIComponent):
         
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Check if clicked on input
-            self.active = self.is_hovered()
+            self.active = self.is_hovered(getattr(event, 'pos', None))
             self.cursor_visible = True
             self.cursor_timer = 0.0
             return self.active
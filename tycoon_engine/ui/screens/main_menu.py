@@ -39,7 +39,7 @@ class MainMenuScreen(GameState):
             on_play: Callback for Play button (defaults to changing to "playing" state)
             on_multiplayer: Callback for Multiplayer button (defaults to "multiplayer" state)
             on_settings: Callback for Settings button (defaults to "settings" state)
-            on_quit: Callback for Quit button (defaults to pygame.QUIT event)
+            on_quit: Callback for Quit button (defaults to quitting the game)
             background_color: RGB background color
         """
         super().__init__(state_manager)
@@ -208,5 +208,5 @@ class MainMenuScreen(GameState):
         if self.on_quit:
             self.on_quit()
         else:
-            # Default: post QUIT event
-            pygame.event.post(pygame.event.Event(pygame.QUIT))
+            # Default: stop the game loop
+            self.state_manager.request_quit()
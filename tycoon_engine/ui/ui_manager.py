@@ -5,7 +5,7 @@ Manages UI element lifecycle, event routing, and rendering order.
 """
 
 import pygame
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set, Tuple
 from tycoon_engine.ui.components import UIComponent
 
 
@@ -22,7 +22,10 @@ class UIManager:
     
     def __init__(self):
         """Initialize the UI manager."""
+        # Components in render order (last renders on top). The set mirrors
+        # the list so membership checks don't scan it.
         self.components: List[UIComponent] = []
+        self._component_set: Set[UIComponent] = set()
         self.focused_component: Optional[UIComponent] = None
     
     def add_component(self, component: UIComponent, z_order: Optional[int] = None) -> None:
@@ -34,10 +37,16 @@ class UIManager:
             z_order: Optional z-order for rendering (higher values render on top).
                     Note: This is a placeholder for future implementation.
                     Currently components render in order added.
+        
+        Adding a component that is already managed has no effect.
         """
+        if component in self._component_set:
+            return
+        
         # TODO: Implement proper z-ordering system
         # For now, just append to the list
         self.components.append(component)
+        self._component_set.add(component)
     
     def remove_component(self, component: UIComponent) -> None:
         """
@@ -46,8 +55,9 @@ class UIManager:
         Args:
             component: Component to remove
         """
-        if component in self.components:
+        if component in self._component_set:
             self.components.remove(component)
+            self._component_set.discard(component)
             
             # Clear focus if this was the focused component
             if self.focused_component == component:
@@ -56,6 +66,7 @@ class UIManager:
     def clear_all(self) -> None:
         """Remove all components."""
         self.components.clear()
+        self._component_set.clear()
         self.focused_component = None
     
     def update(self, dt: float) -> None:
@@ -164,9 +175,10 @@ class UIManager:
         Args:
             component: Component to bring forward
         """
-        if component in self.components:
-            self.components.remove(component)
-            self.components.append(component)
+        components = self.components
+        if component in self._component_set and components[-1] is not component:
+            components.remove(component)
+            components.append(component)
     
     def send_to_back(self, component: UIComponent) -> None:
         """
@@ -175,9 +187,10 @@ class UIManager:
         Args:
             component: Component to send back
         """
-        if component in self.components:
-            self.components.remove(component)
-            self.components.insert(0, component)
+        components = self.components
+        if component in self._component_set and components[0] is not component:
+            components.remove(component)
+            components.insert(0, component)
     
     def show_all(self) -> None:
         """Make all components visible."""
@@ -199,14 +212,25 @@ class UIManager:
         for component in self.components:
             component.enabled = False
     
-    def get_components(self) -> List[UIComponent]:
+    def get_components(self) -> Tuple[UIComponent, ...]:
+        """
+        Get all managed components.
+        
+        Returns:
+            Immutable snapshot of the components in render order
+        """
+        return tuple(self.components)
+    
+    def iter_components(self) -> Iterator[UIComponent]:
         """
-        Get list of all managed components.
+        Iterate over managed components in render order without copying.
+        
+        Components must not be added or removed while iterating.
         
         Returns:
-            List of components
+            Iterator over the components
         """
-        return self.components.copy()
+        return iter(self.components)
     
     def count(self) -> int:
         """
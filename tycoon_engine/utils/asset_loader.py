@@ -5,11 +5,43 @@ Provides resource loading and management for images, fonts, and audio files.
 """
 
 import pygame
+import io
 import os
-from typing import Dict, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 
+# Maximum number of (font, size) combinations kept in memory
+FONT_CACHE_SIZE = 64
+
+# Number of threads used to read files in preload_assets
+PRELOAD_WORKERS = 8
+
+
+@lru_cache(maxsize=256)
+def _resolve_asset_path(base_path: Path, relative_path: str) -> Path:
+    """
+    Resolve an asset path against a base directory.
+    
+    Results are memoized because games request the same few asset paths
+    over and over.
+    
+    Args:
+        base_path: Base directory for relative paths
+        relative_path: Relative or absolute path to asset
+        
+    Returns:
+        Absolute path to asset
+    """
+    path = Path(relative_path)
+    if path.is_absolute():
+        return path
+    return base_path / path
+
+
 class AssetLoader:
     """
     Asset loader and manager for game resources.
@@ -31,8 +63,10 @@ class AssetLoader:
         self.base_path = Path(base_path) if base_path else Path.cwd()
         
         # Caches for loaded resources
-        self._image_cache: Dict[str, pygame.Surface] = {}
-        self._font_cache: Dict[Tuple[str, int], pygame.font.Font] = {}
+        # Fonts are cheap to recreate, so they live in a bounded LRU cache;
+        # images and sounds stay cached until cleared (e.g. after preloading)
+        self._image_cache: Dict[Tuple[str, Optional[Tuple[int, int]]], pygame.Surface] = {}
+        self._font_cache = lru_cache(maxsize=FONT_CACHE_SIZE)(self._open_font)
         self._sound_cache: Dict[str, pygame.mixer.Sound] = {}
         
         # Track loaded music file
@@ -72,10 +106,7 @@ class AssetLoader:
         Returns:
             Absolute path to asset
         """
-        path = Path(relative_path)
-        if path.is_absolute():
-            return path
-        return self.base_path / path
+        return _resolve_asset_path(self.base_path, relative_path)
     
     def load_image(
         self, 
@@ -99,9 +130,10 @@ class AssetLoader:
             pygame.error: If image cannot be loaded
         """
         # Check cache first
-        cache_key = f"{path}_{scale}"
-        if cache_key in self._image_cache:
-            return self._image_cache[cache_key]
+        cache_key = (path, scale)
+        image = self._image_cache.get(cache_key)
+        if image is not None:
+            return image
         
         # Resolve and load image
         full_path = self._resolve_path(path)
@@ -132,6 +164,9 @@ class AssetLoader:
         """
         Load a font file.
         
+        The least recently used fonts are evicted once more than
+        FONT_CACHE_SIZE (path, size) combinations have been loaded.
+        
         Args:
             path: Path to font file (TTF, OTF). If None, uses pygame default font.
             size: Font size in points
@@ -143,26 +178,29 @@ class AssetLoader:
             FileNotFoundError: If font file doesn't exist
             pygame.error: If font cannot be loaded
         """
-        # Check cache first
-        cache_key = (path or "default", size)
-        if cache_key in self._font_cache:
-            return self._font_cache[cache_key]
+        return self._font_cache(path, size)
+    
+    def _open_font(self, path: Optional[str], size: int) -> pygame.font.Font:
+        """
+        Create a font without consulting the cache.
         
+        Args:
+            path: Path to font file, or None for the pygame default font
+            size: Font size in points
+            
+        Returns:
+            Loaded pygame Font
+        """
         try:
             if path is None:
                 # Use default pygame font
-                font = pygame.font.Font(None, size)
-            else:
-                # Resolve and load custom font
-                full_path = self._resolve_path(path)
-                if not full_path.exists():
-                    raise FileNotFoundError(f"Font not found: {full_path}")
-                font = pygame.font.Font(str(full_path), size)
-            
-            # Cache the font
-            self._font_cache[cache_key] = font
+                return pygame.font.Font(None, size)
             
-            return font
+            # Resolve and load custom font
+            full_path = self._resolve_path(path)
+            if not full_path.exists():
+                raise FileNotFoundError(f"Font not found: {full_path}")
+            return pygame.font.Font(str(full_path), size)
         except pygame.error as e:
             raise pygame.error(f"Failed to load font: {e}")
     
@@ -181,8 +219,9 @@ class AssetLoader:
             pygame.error: If sound cannot be loaded
         """
         # Check cache first
-        if path in self._sound_cache:
-            return self._sound_cache[path]
+        sound = self._sound_cache.get(path)
+        if sound is not None:
+            return sound
         
         # Resolve and load sound
         full_path = self._resolve_path(path)
@@ -269,13 +308,12 @@ class AssetLoader:
         Args:
             volume: Volume level (0.0 to 1.0)
         """
-        volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.set_volume(max(0.0, min(1.0, volume)))
     
     def clear_cache(self) -> None:
         """Clear all cached assets to free memory."""
         self._image_cache.clear()
-        self._font_cache.clear()
+        self._font_cache.cache_clear()
         self._sound_cache.clear()
     
     def clear_images(self) -> None:
@@ -284,7 +322,7 @@ class AssetLoader:
     
     def clear_fonts(self) -> None:
         """Clear only the font cache."""
-        self._font_cache.clear()
+        self._font_cache.cache_clear()
     
     def clear_sounds(self) -> None:
         """Clear only the sound cache."""
@@ -299,7 +337,7 @@ class AssetLoader:
         """
         return {
             'images': len(self._image_cache),
-            'fonts': len(self._font_cache),
+            'fonts': self._font_cache.cache_info().currsize,
             'sounds': len(self._sound_cache)
         }
     
@@ -317,12 +355,24 @@ class AssetLoader:
             fonts: List of (path, size) tuples for fonts to preload
             sounds: List of sound paths to preload
         """
-        if images:
-            for image_path in images:
-                try:
-                    self.load_image(image_path)
-                except (FileNotFoundError, pygame.error) as e:
-                    print(f"Warning: Could not preload image {image_path}: {e}")
+        # Read image and sound files concurrently; decoding and surface
+        # conversion still happen on this (the pygame) thread
+        pending_images = [
+            path for path in (images or [])
+            if (path, None) not in self._image_cache
+        ]
+        pending_sounds = [path for path in (sounds or []) if path not in self._sound_cache]
+        file_data = self._read_files(pending_images + pending_sounds)
+        
+        for image_path in pending_images:
+            try:
+                data = file_data[image_path]
+                if isinstance(data, Exception):
+                    raise data
+                image = pygame.image.load(io.BytesIO(data), str(image_path))
+                self._image_cache[(image_path, None)] = image.convert_alpha()
+            except (OSError, pygame.error) as e:
+                print(f"Warning: Could not preload image {image_path}: {e}")
         
         if fonts:
             for font_path, size in fonts:
@@ -331,16 +381,47 @@ class AssetLoader:
                 except (FileNotFoundError, pygame.error) as e:
                     print(f"Warning: Could not preload font {font_path}: {e}")
         
-        if sounds:
-            for sound_path in sounds:
-                try:
-                    self.load_sound(sound_path)
-                except (FileNotFoundError, pygame.error) as e:
-                    print(f"Warning: Could not preload sound {sound_path}: {e}")
+        for sound_path in pending_sounds:
+            try:
+                data = file_data[sound_path]
+                if isinstance(data, Exception):
+                    raise data
+                self._sound_cache[sound_path] = pygame.mixer.Sound(file=io.BytesIO(data))
+            except (OSError, pygame.error) as e:
+                print(f"Warning: Could not preload sound {sound_path}: {e}")
+    
+    def _read_files(self, paths: List[str]) -> Dict[str, object]:
+        """
+        Read several asset files in a thread pool.
+        
+        File reads release the GIL, so they overlap with each other.
+        
+        Args:
+            paths: Asset paths (relative to base_path or absolute)
+            
+        Returns:
+            Dictionary mapping each path to its bytes, or to the OSError
+            raised when it could not be read, so one bad file doesn't stop
+            the others
+        """
+        def read(path):
+            full_path = self._resolve_path(path)
+            try:
+                return full_path.read_bytes()
+            except FileNotFoundError:
+                return FileNotFoundError(f"Asset not found: {full_path}")
+            except OSError as e:
+                return e
+        
+        if not paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(PRELOAD_WORKERS, len(paths))) as executor:
+            return dict(zip(paths, executor.map(read, paths)))
 
 
 # Global asset loader instance (singleton pattern)
 _global_loader: Optional[AssetLoader] = None
+_global_loader_lock = threading.Lock()
 
 
 def get_asset_loader(base_path: Optional[str] = None) -> AssetLoader:
@@ -355,5 +436,9 @@ def get_asset_loader(base_path: Optional[str] = None) -> AssetLoader:
     """
     global _global_loader
     if _global_loader is None:
-        _global_loader = AssetLoader(base_path)
+        # Only the first call takes the lock; it guarantees a single instance
+        # even if several threads ask for the loader at the same time
+        with _global_loader_lock:
+            if _global_loader is None:
+                _global_loader = AssetLoader(base_path)
     return _global_loader
@@ -2,8 +2,11 @@
 Utility functions for the game engine.
 """
 
+import heapq
+import itertools
+import math
 import time
-from typing import Callable
+from typing import Callable, Dict, List, Tuple
 
 
 class Timer:
@@ -53,6 +56,104 @@ class Timer:
         self.active = False
 
 
+class TimerWheel:
+    """
+    Drives many timers from a single update call.
+    
+    Timers are kept in a heap ordered by their next deadline, so an update
+    only touches the timers that fire instead of every registered timer.
+    Timing matches Timer: a repeating timer fires at most once per update
+    and carries any excess time over to its next deadline.
+    """
+    
+    def __init__(self):
+        """Initialize an empty timer wheel."""
+        self._time = 0.0
+        self._ids = itertools.count(1)
+        
+        # Timer ID -> (interval, callback, repeat) for registered timers
+        self._timers: Dict[int, Tuple[float, Callable[[], None], bool]] = {}
+        
+        # (deadline, timer ID); entries of removed timers are skipped when popped
+        self._deadlines: List[Tuple[float, int]] = []
+    
+    def add_timer(self, interval: float, callback: Callable[[], None], repeat: bool = True) -> int:
+        """
+        Register a timer.
+        
+        Args:
+            interval: Time interval in seconds (must be positive)
+            callback: Function to call when timer expires
+            repeat: Whether to repeat the timer
+            
+        Returns:
+            Timer ID, used to remove the timer
+        
+        Raises:
+            ValueError: If interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError("Timer interval must be positive")
+        timer_id = next(self._ids)
+        self._timers[timer_id] = (interval, callback, repeat)
+        heapq.heappush(self._deadlines, (self._time + interval, timer_id))
+        return timer_id
+    
+    def remove_timer(self, timer_id: int) -> bool:
+        """
+        Remove a timer.
+        
+        Args:
+            timer_id: ID returned by add_timer
+            
+        Returns:
+            True if removed, False if not found (or already finished)
+        """
+        return self._timers.pop(timer_id, None) is not None
+    
+    def update(self, dt: float) -> None:
+        """
+        Advance all timers and call those that expire.
+        
+        Args:
+            dt: Delta time in seconds
+        """
+        self._time += dt
+        now = self._time
+        deadlines = self._deadlines
+        timers = self._timers
+        rescheduled = []
+        
+        while deadlines and deadlines[0][0] <= now:
+            deadline, timer_id = heapq.heappop(deadlines)
+            timer = timers.get(timer_id)
+            if timer is None:
+                continue
+            
+            interval, callback, repeat = timer
+            if not repeat:
+                del timers[timer_id]
+            callback()
+            
+            # The callback may have removed its own timer
+            if repeat and timer_id in timers:
+                # Next deadline counts from the previous one to preserve timing
+                # accuracy; it is not fired again during this update
+                rescheduled.append((deadline + interval, timer_id))
+        
+        for entry in rescheduled:
+            heapq.heappush(deadlines, entry)
+    
+    def count(self) -> int:
+        """
+        Get the number of registered timers.
+        
+        Returns:
+            Number of timers
+        """
+        return len(self._timers)
+
+
 def clamp(value: float, min_value: float, max_value: float) -> float:
     """Clamp a value between min and max."""
     return max(min_value, min(value, max_value))
@@ -65,4 +166,4 @@ def lerp(start: float, end: float, t: float) -> float:
 
 def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """Calculate distance between two points."""
-    return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+    return math.hypot(x2 - x1, y2 - y1)